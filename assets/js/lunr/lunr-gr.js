@@ -475,52 +475,78 @@ var idx = lunr(function () {
   }
 });
 
+function buildQuery(query) {
+  return function (q) {
+    query.split(lunr.tokenizer.separator).forEach(function (term) {
+      q.term(term, { boost: 100 })
+      if(query.lastIndexOf(" ") != query.length-1){
+        q.term(term, { usePipeline: false, wildcard: lunr.Query.wildcard.TRAILING, boost: 10 })
+      }
+      if (term != ""){
+        q.term(term, { usePipeline: false, editDistance: 1, boost: 1 })
+      }
+    })
+  };
+}
+
+// Publications come from the index prebuilt by paper_parser.py (publications-search.js), not from store.
+function publicationsResult(query) {
+  if (typeof loadPublicationsSearch !== 'function') {
+    return Promise.resolve([]);
+  }
+  return loadPublicationsSearch().then(function (pubs) {
+    return pubs.index.query(buildQuery(query)).map(function (r) { return pubs.store[r.ref]; });
+  }, function () { return []; });
+}
+
 $(document).ready(function() {
   $('input#search').on('keyup', function () {
     var resultdiv = $('#results');
     var query = $(this).val().toLowerCase();
-    var result =
-      idx.query(function (q) {
-        query.split(lunr.tokenizer.separator).forEach(function (term) {
-          q.term(term, { boost: 100 })
-          if(query.lastIndexOf(" ") != query.length-1){
-            q.term(term, { usePipeline: false, wildcard: lunr.Query.wildcard.TRAILING, boost: 10 })
-          }
-          if (term != ""){
-            q.term(term, { usePipeline: false, editDistance: 1, boost: 1 })
-          }
-        })
-      });
-    resultdiv.empty();
-    resultdiv.prepend('<p class="results__found">'+result.length+' {{ site.data.ui-text[site.locale].results_found | default: "Result(s) found" }}</p>');
-    for (var item in result) {
-      var ref = result[item].ref;
-      if(store[ref].teaser){
-        var searchitem =
-          '<div class="list__item">'+
-            '<article class="archive__item" itemscope itemtype="https://schema.org/CreativeWork">'+
-              '<h2 class="archive__item-title" itemprop="headline">'+
-                '<a href="'+store[ref].url+'" rel="permalink">'+store[ref].title+'</a>'+
-              '</h2>'+
-              '<div class="archive__item-teaser">'+
-                '<img src="'+store[ref].teaser+'" alt="">'+
-              '</div>'+
-              '<p class="archive__item-excerpt" itemprop="description">'+store[ref].excerpt.split(" ").splice(0,20).join(" ")+'...</p>'+
-            '</article>'+
-          '</div>';
+    var result = idx.query(buildQuery(query));
+    publicationsResult(query).then(function (papers) {
+      resultdiv.empty();
+      resultdiv.prepend('<p class="results__found">'+(result.length+papers.length)+' {{ site.data.ui-text[site.locale].results_found | default: "Result(s) found" }}</p>');
+      for (var item in result) {
+        var ref = result[item].ref;
+        if(store[ref].teaser){
+          var searchitem =
+            '<div class="list__item">'+
+              '<article class="archive__item" itemscope itemtype="https://schema.org/CreativeWork">'+
+                '<h2 class="archive__item-title" itemprop="headline">'+
+                  '<a href="'+store[ref].url+'" rel="permalink">'+store[ref].title+'</a>'+
+                '</h2>'+
+                '<div class="archive__item-teaser">'+
+                  '<img src="'+store[ref].teaser+'" alt="">'+
+                '</div>'+
+                '<p class="archive__item-excerpt" itemprop="description">'+store[ref].excerpt.split(" ").splice(0,20).join(" ")+'...</p>'+
+              '</article>'+
+            '</div>';
+        }
+        else{
+      	  var searchitem =
+            '<div class="list__item">'+
+              '<article class="archive__item" itemscope itemtype="https://schema.org/CreativeWork">'+
+                '<h2 class="archive__item-title" itemprop="headline">'+
+                  '<a href="'+store[ref].url+'" rel="permalink">'+store[ref].title+'</a>'+
+                '</h2>'+
+                '<p class="archive__item-excerpt" itemprop="description">'+store[ref].excerpt.split(" ").splice(0,20).join(" ")+'...</p>'+
+              '</article>'+
+            '</div>';
+        }
+        resultdiv.append(searchitem);
       }
-      else{
-    	  var searchitem =
+      papers.forEach(function (paper) {
+        resultdiv.append(
           '<div class="list__item">'+
             '<article class="archive__item" itemscope itemtype="https://schema.org/CreativeWork">'+
               '<h2 class="archive__item-title" itemprop="headline">'+
-                '<a href="'+store[ref].url+'" rel="permalink">'+store[ref].title+'</a>'+
+                '<a href="'+paper.link+'" target="_blank" rel="noopener">'+paper.title+'</a>'+
               '</h2>'+
-              '<p class="archive__item-excerpt" itemprop="description">'+store[ref].excerpt.split(" ").splice(0,20).join(" ")+'...</p>'+
+              '<p class="archive__item-excerpt" itemprop="description">'+paper.authors_html+' — '+paper.venue+(paper.year ? ' ('+paper.year+')' : '')+'</p>'+
             '</article>'+
-          '</div>';
-      }
-      resultdiv.append(searchitem);
-    }
+          '</div>');
+      });
+    });
   });
 });
@@ -0,0 +1,17 @@
+---
+layout: none
+---
+// Generated by paper_parser.py; do not edit.
+// loadPublicationsSearch() resolves to {index: lunr.Index, store: {ref: {title, link, authors_html, venue, year}}},
+// store values HTML-escaped. lunr-en.js / lunr-gr.js query it next to their in-browser index.
+var loadPublicationsSearch = (function () {
+  var pending = null;
+  return function () {
+    if (!pending) {
+      pending = fetch("{{ '/assets/js/lunr/publications-index.15d1c127a6eb.json' | relative_url }}")
+        .then(function (response) { return response.json(); })
+        .then(function (data) { return {index: lunr.Index.load(data.index), store: data.store}; });
+    }
+    return pending;
+  };
+})();
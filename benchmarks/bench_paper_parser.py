@@ -0,0 +1,702 @@
+#!/usr/bin/env python3
+"""
+Benchmark the paper_parser.py sync pipeline against replayed OpenAlex data.
+
+No network is used: a stand-in for requests.Session serves /works and /authors
+pages (filters, cursor paging, sort, select=) from an in-memory corpus.
+
+Corpus sources:
+  (default)        benchmarks/fixtures/openalex: committed /works and /authors
+                   pages in OpenAlex response format (see its README.md)
+  --fixtures DIR   recorded OpenAlex responses: raw page JSON files and/or a
+                   response cache written by `paper_parser.py --http-cache-dir DIR`
+  --fixtures site  works rebuilt on the fly from this site's _publications + _members
+
+--write-fixture-pages regenerates benchmarks/fixtures/openalex from the site
+(only when the baseline corpus should change; numbers are not comparable across it).
+
+Each --scales factor K > 1 adds synthetic members and K-1 synthetic copies of
+every work with heavy co-authorship duplication (several members per paper).
+
+Output (stdout or --output) is JSON: per scale, wall time per pipeline stage,
+peak Python memory (tracemalloc), HTTP and file counters, so runs can be
+diffed across commits.
+
+--title-case-golden checks title_case_paper_title() and title_case_many()
+against benchmarks/fixtures/title_case_golden.json (this site's titles plus
+edge cases) and exits non-zero on any difference; run it after touching the
+title casing code. --update-title-case-golden regenerates that file from the
+current implementation (only when a behaviour change is intended).
+
+--micro times the text helpers (sanitize_yaml_scalar, norm_name, slugify,
+title_key_lower) per call against the pre-optimisation implementations kept
+below, on this site's titles and author names plus noisy variants, and exits
+non-zero if any output differs.
+
+Usage:
+  python benchmarks/bench_paper_parser.py --scales 1 10 100 --output bench.json
+  python benchmarks/bench_paper_parser.py --fixtures .openalex_http_cache -- --fetch-mode batched
+  python benchmarks/bench_paper_parser.py --title-case-golden
+  python benchmarks/bench_paper_parser.py --micro
+  python benchmarks/bench_paper_parser.py --write-fixture-pages
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import paper_parser as pp  # noqa: E402
+
+
+# ----------------------------
+# Corpus
+# ----------------------------
+
+class Corpus:
+    def __init__(self, works: List[Dict[str, Any]], authors: List[Dict[str, Any]]):
+        self.works = works
+        self.authors = authors
+
+
+def load_recorded_corpus(fixtures_dir: Path) -> Corpus:
+    """Collect works/authors from recorded page JSON (plain pages or ResponseCache entries)."""
+    works: Dict[str, Dict[str, Any]] = {}
+    authors: Dict[str, Dict[str, Any]] = {}
+    for p in sorted(fixtures_dir.rglob("*.json")):
+        try:
+            data = json.loads(p.read_text(encoding="utf-8"))
+        except ValueError:
+            continue
+        page = data.get("body", data) if isinstance(data, dict) else {}
+        for r in (page.get("results") or []) if isinstance(page, dict) else []:
+            rid = pp.canonical_openalex_id(r.get("id") or "")
+            if not rid:
+                continue
+            if "authorships" in r:
+                works[rid] = r
+            elif rid.upper().startswith("A"):
+                authors[rid] = r
+    if not works:
+        raise SystemExit(f"No recorded /works results found under {fixtures_dir}")
+    return Corpus(list(works.values()), list(authors.values()))
+
+
+def _member_ids(repo: Path) -> Dict[str, str]:
+    """Member name -> short OpenAlex author id (front matter first, then the author cache)."""
+    cache_path = repo / ".openalex_author_cache.json"
+    cache = json.loads(cache_path.read_text(encoding="utf-8")) if cache_path.exists() else {}
+    ids: Dict[str, str] = {}
+    for m in pp.load_members(repo / "_members"):
+        aid = m.openalex_author_id or (cache.get(m.name_norm) or {}).get("openalex_author_id")
+        if aid:
+            ids[m.name] = pp.canonical_openalex_id(aid).upper()
+    return ids
+
+
+def site_corpus(repo: Path) -> Corpus:
+    """Rebuild OpenAlex-shaped works from the site's current _publications front matter."""
+    member_ids = _member_ids(repo)
+    works: List[Dict[str, Any]] = []
+    for p in sorted((repo / "_publications").glob("*.md")):
+        fm, _ = pp.read_front_matter(p)
+        if not fm.get("openalex_work_id"):
+            continue
+        names = [a.strip().strip("*") for a in str(fm.get("authors") or "").split(",")]
+        authorships = []
+        for name in names:
+            if not name or name == "et al.":
+                continue
+            aid = member_ids.get(name) or f"A9{int(pp.hashlib.sha1(name.encode()).hexdigest()[:8], 16):010d}"
+            authorships.append({"author": {"id": f"https://openalex.org/{aid}", "display_name": name}})
+        link = str(fm.get("link") or "")
+        date = str(fm.get("date") or "")
+        works.append({
+            "id": f"https://openalex.org/{fm['openalex_work_id']}",
+            "doi": link if "doi.org/" in link else None,
+            "display_name": fm.get("title") or "",
+            "publication_date": date,
+            "publication_year": int(date[:4]) if date[:4].isdigit() else None,
+            "authorships": authorships,
+            "primary_location": {"landing_page_url": link, "source": {"display_name": fm.get("venue") or ""}},
+            "cited_by_count": 0,
+        })
+    authors = [
+        {"id": f"https://openalex.org/{aid}", "display_name": name, "works_count": 0, "last_known_institution": None}
+        for name, aid in member_ids.items()
+    ]
+    return Corpus(works, authors)
+
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parent / "fixtures" / "openalex"
+FIXTURE_PAGE_SIZE = 25
+
+# venue name -> OpenAlex source type, for the fixture pages
+_CONFERENCE_RE = re.compile(r"conference|proceedings|workshop|symposium|\bicml\b|\bneurips\b|\bcvpr|\biclr\b", re.I)
+
+
+def _fixture_source_type(venue: str) -> str:
+    if pp._PREPRINT_SOURCE_RE.search(venue):
+        return "repository"
+    return "conference" if _CONFERENCE_RE.search(venue) else "journal"
+
+
+def _fixture_int(key: str, lo: int, hi: int) -> int:
+    """Deterministic pseudo-random int for fixture fields the site does not record."""
+    return lo + int(pp.hashlib.sha1(key.encode("utf-8")).hexdigest()[:8], 16) % (hi - lo + 1)
+
+
+def fixture_pages(repo: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Full OpenAlex-shaped /works and /authors result pages built from the site:
+    member author IDs from _members / the author cache, complete authorships,
+    primary_location.source with a type (arXiv & co. are repositories), locations,
+    ids, open_access and reference lists, plus same-name decoy authors, so
+    select=, dedupe quality keys and author scoring see realistic records.
+    """
+    site = site_corpus(repo)
+    works = []
+    for w in site.works:
+        wid = pp.canonical_openalex_id(w["id"])
+        venue = w["primary_location"]["source"]["display_name"]
+        link = w["primary_location"]["landing_page_url"]
+        year = w.get("publication_year") or 0
+        source = {
+            "id": f"https://openalex.org/S{_fixture_int(venue, 10**9, 5 * 10**9)}",
+            "display_name": venue,
+            "issn_l": None,
+            "is_oa": _fixture_int(venue + "oa", 0, 1) == 1,
+            "host_organization_name": None,
+            "type": _fixture_source_type(venue),
+        } if venue else None
+        location = {"is_oa": bool(source and source["is_oa"]), "landing_page_url": link, "pdf_url": None, "source": source,
+                    "license": None, "version": "publishedVersion" if source and source["type"] != "repository" else "submittedVersion"}
+        n = len(w["authorships"])
+        works.append({
+            "id": w["id"],
+            "doi": w["doi"],
+            "title": w["display_name"],
+            "display_name": w["display_name"],
+            "publication_year": year,
+            "publication_date": w["publication_date"],
+            "ids": {"openalex": w["id"], **({"doi": w["doi"]} if w["doi"] else {})},
+            "language": "en",
+            "primary_location": location,
+            "type": "preprint" if source and source["type"] == "repository" else "article",
+            "open_access": {"is_oa": location["is_oa"], "oa_status": "green" if location["is_oa"] else "closed", "oa_url": None},
+            "authorships": [
+                {
+                    "author_position": "first" if i == 0 else ("last" if i == n - 1 else "middle"),
+                    "author": {**a["author"], "orcid": None},
+                    "institutions": [],
+                    "countries": [],
+                    "is_corresponding": i == 0,
+                    "raw_author_name": a["author"]["display_name"],
+                    "raw_affiliation_strings": [],
+                }
+                for i, a in enumerate(w["authorships"])
+            ],
+            "cited_by_count": _fixture_int(wid + "cites", 0, 40 * max(0, 2026 - year)),
+            "locations_count": 1,
+            "locations": [location],
+            "best_oa_location": location if location["is_oa"] else None,
+            "referenced_works_count": 2,
+            "referenced_works": [f"https://openalex.org/W{_fixture_int(wid + str(k), 10**9, 5 * 10**9)}" for k in range(2)],
+            "updated_date": f"{max(year, 2024)}-06-01T00:00:00.000000",
+            "created_date": w["publication_date"] or f"{year}-01-01",
+        })
+
+    authors = []
+    for a in site.authors:
+        aid = pp.canonical_openalex_id(a["id"])
+        name = a["display_name"]
+        count = sum(1 for w in site.works for x in w["authorships"] if pp.canonical_openalex_id(x["author"]["id"]) == aid)
+        for decoy, (rid, works_count) in enumerate(((aid, count), (f"A8{_fixture_int(name, 10**8, 10**9 - 1):09d}", count * 3 + 7))):
+            authors.append({
+                "id": f"https://openalex.org/{rid}",
+                "display_name": name,
+                "display_name_alternatives": [name] if not decoy else [],
+                "works_count": works_count,
+                "cited_by_count": 10 * works_count,
+                "last_known_institutions": [{"display_name": "Unrelated University" if decoy else "Wageningen University & Research"}],
+            })
+
+    pages: Dict[str, Dict[str, Any]] = {}
+    for start in range(0, len(works), FIXTURE_PAGE_SIZE):
+        chunk = works[start:start + FIXTURE_PAGE_SIZE]
+        pages[f"works-{start // FIXTURE_PAGE_SIZE + 1:03d}.json"] = {"meta": {"count": len(works)}, "results": chunk}
+    pages["authors-001.json"] = {"meta": {"count": len(authors)}, "results": authors}
+    return pages
+
+
+def write_fixture_pages(repo: Path, out_dir: Path) -> int:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for old in out_dir.glob("*.json"):
+        old.unlink()
+    pages = fixture_pages(repo)
+    for name, page in pages.items():
+        (out_dir / name).write_text(json.dumps(page, indent=1, ensure_ascii=False) + "\n", encoding="utf-8")
+    return sum(len(p["results"]) for n, p in pages.items() if n.startswith("works-"))
+
+
+def scale_corpus(corpus: Corpus, pi_id: str, scale: int, seed: int = 0) -> Tuple[Corpus, List[Tuple[str, str]]]:
+    """
+    Return (corpus, synthetic members). Adds members and K-1 copies of every work;
+    each copy is co-authored by the PI (mostly) and 2-6 synthetic members.
+    """
+    if scale <= 1:
+        return corpus, []
+    rnd = random.Random(seed)
+    n_members = max(1, len(corpus.authors)) * scale
+    synth_members = [(f"Synthetic Member {i:05d}", f"A7{i:09d}") for i in range(n_members)]
+    works = list(corpus.works)
+    authors = list(corpus.authors)
+    authors.extend(
+        {"id": f"https://openalex.org/{aid}", "display_name": name, "works_count": 0, "last_known_institution": None}
+        for name, aid in synth_members
+    )
+    for k in range(1, scale):
+        for j, w in enumerate(corpus.works):
+            copy = json.loads(json.dumps(w))
+            copy["id"] = f"https://openalex.org/W6{k:04d}{j:07d}"
+            if copy.get("doi"):
+                copy["doi"] = f"{copy['doi']}.s{k}"
+            copy["display_name"] = f"{w.get('display_name') or ''} (Part {k})"
+            extra = rnd.sample(synth_members, min(len(synth_members), rnd.randint(2, 6)))
+            auths = [a for a in copy.get("authorships") or [] if rnd.random() < 0.5]
+            if rnd.random() < 0.8:
+                auths.insert(0, {"author": {"id": f"https://openalex.org/{pi_id}", "display_name": "Marc Rußwurm"}})
+            auths.extend({"author": {"id": f"https://openalex.org/{aid}", "display_name": name}} for name, aid in extra)
+            copy["authorships"] = auths
+            copy["cited_by_count"] = rnd.randint(0, 200)
+            works.append(copy)
+    return Corpus(works, authors), synth_members
+
+
+# ----------------------------
+# Stand-in for requests.Session
+# ----------------------------
+
+class FixtureResponse:
+    def __init__(self, payload: Dict[str, Any], status_code: int = 200):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode("utf-8")
+        self.headers: Dict[str, str] = {}
+
+    def json(self) -> Dict[str, Any]:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise pp.requests.HTTPError(f"{self.status_code} from fixture server", response=self)
+
+
+class FixtureServer:
+    """Answers OpenAlex /works and /authors queries from a Corpus; counts requests and bytes."""
+
+    def __init__(self, corpus: Corpus):
+        self.corpus = corpus
+        self.lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        self.bytes = 0
+        self.by_author: Dict[str, List[int]] = {}
+        self.by_work: Dict[str, int] = {}
+        for i, w in enumerate(corpus.works):
+            self.by_work[pp.canonical_openalex_id(w.get("id") or "").upper()] = i
+            for aid in pp.work_author_ids(w):
+                self.by_author.setdefault(aid, []).append(i)
+
+    def session(self) -> "FixtureSession":
+        return FixtureSession(self)
+
+    def _clause(self, clause: str) -> Tuple[str, List[str]]:
+        key, _, value = clause.partition(":")
+        return key, [pp.canonical_openalex_id(v).upper() for v in value.split("|")]
+
+    def _works(self, filter_expr: str) -> List[Dict[str, Any]]:
+        candidates: Optional[set] = None
+        post: List[Tuple[str, str]] = []
+        for clause in [c for c in filter_expr.split(",") if c]:
+            key, values = self._clause(clause)
+            if key == "authorships.author.id":
+                hits = {i for v in values for i in self.by_author.get(v, [])}
+            elif key in ("openalex_id", "openalex", "ids.openalex"):
+                hits = {self.by_work[v] for v in values if v in self.by_work}
+            elif key in ("from_updated_date", "from_created_date"):
+                post.append((key, clause.partition(":")[2]))
+                continue
+            else:
+                raise ValueError(f"Fixture server does not support filter {clause!r}")
+            candidates = hits if candidates is None else candidates & hits
+        idx = sorted(candidates if candidates is not None else range(len(self.corpus.works)))
+        works = [self.corpus.works[i] for i in idx]
+        for key, day in post:
+            field = "updated_date" if key == "from_updated_date" else "created_date"
+            works = [w for w in works if str(w.get(field) or "9999") >= day]
+        return works
+
+    def get(self, url: str, params: Dict[str, Any]) -> FixtureResponse:
+        path = urlparse(url).path
+        per_page = int(params.get("per-page") or 25)
+        if path == "/authors":
+            terms = pp.norm_name(str(params.get("search") or "")).split()
+            results = [a for a in self.corpus.authors if all(t in pp.norm_name(a.get("display_name") or "") for t in terms)]
+            payload = {"meta": {"count": len(results)}, "results": results[:per_page]}
+        elif path == "/works":
+            works = self._works(str(params.get("filter") or ""))
+            if str(params.get("sort") or "").startswith("publication_date:desc"):
+                works = sorted(works, key=lambda w: str(w.get("publication_date") or ""), reverse=True)
+            cursor = str(params.get("cursor") or "*")
+            start = 0 if cursor == "*" else int(cursor)
+            page = works[start:start + per_page]
+            if params.get("select"):
+                fields = str(params["select"]).split(",")
+                page = [{f: w[f] for f in fields if f in w} for w in page]
+            next_cursor = str(start + per_page) if start + per_page < len(works) else None
+            payload = {"meta": {"count": len(works), "next_cursor": next_cursor}, "results": page}
+        else:
+            return FixtureResponse({"error": f"unknown path {path}"}, status_code=404)
+        resp = FixtureResponse(payload)
+        with self.lock:
+            self.requests[path] = self.requests.get(path, 0) + 1
+            self.bytes += len(resp.content)
+        return resp
+
+
+class FixtureSession:
+    def __init__(self, server: FixtureServer):
+        self.server = server
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, timeout: Any = None, headers: Any = None):
+        return self.server.get(url, dict(params or {}))
+
+
+# ----------------------------
+# Runner
+# ----------------------------
+
+def make_site(repo: Path, synth_members: List[Tuple[str, str]]) -> Path:
+    site = Path(tempfile.mkdtemp(prefix="bench-site-"))
+    shutil.copytree(repo / "_members", site / "_members")
+    cache = repo / ".openalex_author_cache.json"
+    if cache.exists():
+        shutil.copy(cache, site / cache.name)
+    for name, aid in synth_members:
+        slug = pp.slugify(name)
+        (site / "_members" / f"{slug}.md").write_text(
+            f"---\nname: \"{name}\"\nopenalex_author_id: {aid}\n---\n", encoding="utf-8"
+        )
+    return site
+
+
+def run_once(corpus: Corpus, synth: List[Tuple[str, str]], sync_args: List[str], trace_memory: bool) -> Dict[str, Any]:
+    site = make_site(REPO_ROOT, synth)
+    server = FixtureServer(corpus)
+    args = pp.build_arg_parser().parse_args(
+        ["--repo", str(site), "--mailto", "bench@example.org", "--request-interval", "0", "--http-cache-dir", ""]
+        + sync_args
+    )
+    try:
+        if trace_memory:
+            tracemalloc.start()
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            stats = pp.run(args, session_factory=server.session)
+        wall = time.perf_counter() - t0
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+        n_files = len(list((site / "_publications").glob("*.md")))
+        shutil.rmtree(site, ignore_errors=True)
+    return {
+        "wall_s": round(wall, 6),
+        **stats.as_dict(),
+        "peak_mem_bytes": peak,
+        "requests": dict(server.requests),
+        "requests_total": sum(server.requests.values()),
+        "response_bytes": server.bytes,
+        "publication_files": n_files,
+    }
+
+
+# ----------------------------
+# Title casing golden output
+# ----------------------------
+
+TITLE_CASE_GOLDEN = Path(__file__).resolve().parent / "fixtures" / "title_case_golden.json"
+
+TITLE_CASE_EDGE_CASES = [
+    "",
+    "   ",
+    "--",
+    "of",
+    "the end of the world",
+    "state-of-the-art models for the win",
+    "a-of-b and on/off in-the-wild",
+    "semi-supervised learning: a review of the field",
+    "deep learning — a survey – of methods",
+    "ends with a colon: ",
+    "title:subtitle of it",
+    "U.S. flood maps for the e.g. case",
+    "OpenAI, NeRF, eDNA and CNN models in 3D",
+    "v2.0 of the x² and H₂O models",
+    "(re)thinking the (very) basics",
+    "'quoted' and \"double\" words of note",
+    "R&D at AT&T: it's the don't-care state",
+    "word_with_underscore _leading and trailing_",
+    "ÉTUDE DES RÉSEAUX über naïve straße",
+    "Multi$^{\\mathbf{3}}$Net: segmenting flooded buildings",
+    "x/y/z and A/B testing of from-to pairs",
+    "a\u00a0title\twith\nodd\u200bspacing",
+    "MiXeD cAsE wOrDs and McDonald's iPhone",
+    "—leading dash and trailing dash—",
+    "...and so on...",
+    "1st, 2nd and 3rd place",
+    "results of state-of-the-art models in-the-wild today",
+    "learning with/without labels: on-the-fly and per-pixel maps",
+]
+
+
+def title_case_inputs(repo: Path) -> List[str]:
+    """This site's publication titles (as stored, lowercased and uppercased) plus edge cases."""
+    inputs: List[str] = []
+    for p in sorted((repo / "_publications").glob("*.md")):
+        fm, _ = pp.read_front_matter(p)
+        title = fm.get("title")
+        if isinstance(title, str):
+            inputs.extend([title, title.lower(), title.upper()])
+    inputs.extend(TITLE_CASE_EDGE_CASES)
+    return list(dict.fromkeys(inputs))
+
+
+def update_title_case_golden(path: Path) -> int:
+    cases = [[t, pp.title_case_paper_title(t)] for t in title_case_inputs(REPO_ROOT)]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"cases": cases}, indent=1, ensure_ascii=False) + "\n", encoding="utf-8")
+    return len(cases)
+
+
+def check_title_case_golden(path: Path) -> Dict[str, Any]:
+    """Compare single and batch title casing against the golden file; report mismatches and timings."""
+    cases = json.loads(path.read_text(encoding="utf-8"))["cases"]
+    inputs = [c[0] for c in cases]
+    expected = [c[1] for c in cases]
+
+    t0 = time.perf_counter()
+    single = [pp.title_case_paper_title(t) for t in inputs]
+    t1 = time.perf_counter()
+    batch = pp.title_case_many(inputs)
+    t2 = time.perf_counter()
+
+    mismatches = [
+        {"input": t, "expected": e, "single": s, "batch": b}
+        for t, e, s, b in zip(inputs, expected, single, batch)
+        if s != e or b != e
+    ]
+    return {"cases": len(cases), "mismatches": mismatches, "single_s": round(t1 - t0, 6), "batch_s": round(t2 - t1, 6)}
+
+
+# ----------------------------
+# Text helper micro-benchmark (--micro)
+# ----------------------------
+
+# The helpers as they were before regex precompilation / norm_name() memoization,
+# kept verbatim as the baseline.
+
+def _baseline_sanitize_yaml_scalar(s: str) -> str:
+    s = s or ""
+    s = s.replace("\u00A0", " ")
+    s = re.sub(r"[\r\n\t]+", " ", s)
+    s = "".join(ch for ch in s if unicodedata.category(ch)[0] != "C")
+    s = re.sub(r"\s+", " ", s).strip()
+    return s
+
+
+def _baseline_norm_name(s: str) -> str:
+    s = (s or "").replace("ß", "ss")
+    s = unicodedata.normalize("NFKD", s)
+    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    s = s.lower()
+    s = re.sub(r"\s+", " ", s).strip()
+    return s
+
+
+def _baseline_slugify(s: str, max_len: int = 80) -> str:
+    s = _baseline_sanitize_yaml_scalar(s)
+    s = _baseline_norm_name(s)
+    s = re.sub(r"[^a-z0-9]+", "-", s).strip("-")
+    s = re.sub(r"-{2,}", "-", s)
+    return (s[:max_len].strip("-") or "paper")
+
+
+def _baseline_title_key_lower(s: str) -> str:
+    s = _baseline_sanitize_yaml_scalar(s or "")
+    s = re.sub(r"\s+", " ", s).strip().lower()
+    return s
+
+
+def micro_inputs(repo: Path) -> Dict[str, List[str]]:
+    """Titles and author names from _publications / _members, each also upper-cased and with stray whitespace / ZWSP."""
+    titles: List[str] = []
+    names: List[str] = []
+    for p in sorted((repo / "_publications").glob("*.md")):
+        fm, _ = pp.read_front_matter(p)
+        if isinstance(fm.get("title"), str):
+            titles.append(fm["title"])
+        names.extend(a.strip().strip("*") for a in str(fm.get("authors") or "").split(",") if a.strip())
+    for p in sorted((repo / "_members").glob("*.md")):
+        fm, _ = pp.read_front_matter(p)
+        if isinstance(fm.get("name"), str):
+            names.append(fm["name"])
+
+    def variants(xs: List[str]) -> List[str]:
+        out = []
+        for x in xs:
+            out += [x, x.upper(), f"  {x}\n", x.replace(" ", "\u00a0 ", 1), x.replace(" ", "\u200b ", 1)]
+        return out
+
+    return {"titles": variants(titles), "names": variants(names)}
+
+
+def _per_call_us(fn: Any, inputs: List[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        for x in inputs:
+            fn(x)
+        best = min(best, time.perf_counter() - t0)
+    return round(best / len(inputs) * 1e6, 3)
+
+
+def run_micro(repo: Path, repeat: int) -> Dict[str, Any]:
+    """Per-call time of each text helper, baseline vs current, on realistic inputs; outputs must match."""
+    data = micro_inputs(repo)
+    cases = [
+        ("sanitize_yaml_scalar", _baseline_sanitize_yaml_scalar, pp.sanitize_yaml_scalar, data["titles"] + data["names"]),
+        # the pipeline calls norm_name() on the same author names over and over; the uncached row isolates the rewrite
+        ("norm_name", _baseline_norm_name, pp.norm_name, data["names"]),
+        ("norm_name_uncached", _baseline_norm_name, pp.norm_name.__wrapped__, data["names"]),
+        ("slugify", _baseline_slugify, pp.slugify, data["titles"]),
+        ("title_key_lower", _baseline_title_key_lower, pp.title_key_lower, data["titles"]),
+    ]
+    helpers: Dict[str, Any] = {}
+    mismatches = []
+    for name, old, new, inputs in cases:
+        mismatches += [{"helper": name, "input": x, "baseline": old(x), "current": new(x)} for x in inputs if old(x) != new(x)]
+        old_us, new_us = _per_call_us(old, inputs, repeat), _per_call_us(new, inputs, repeat)
+        helpers[name] = {
+            "inputs": len(inputs),
+            "baseline_us": old_us,
+            "current_us": new_us,
+            "speedup": round(old_us / new_us, 2) if new_us else None,
+        }
+    return {"helpers": helpers, "mismatches": mismatches}
+
+
+def git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument(
+        "--fixtures",
+        default=str(DEFAULT_FIXTURES.relative_to(REPO_ROOT)),
+        help="Directory of OpenAlex JSON pages / response cache, or 'site' to rebuild works from _publications",
+    )
+    ap.add_argument("--write-fixture-pages", action="store_true", help="Regenerate the default fixture pages and exit")
+    ap.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100], help="Corpus scale factors")
+    ap.add_argument("--repeat", type=int, default=3, help="Timed runs per scale (fastest is reported)")
+    ap.add_argument("--no-memory", action="store_true", help="Skip the extra tracemalloc run for peak memory")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--output", default="", help="Write JSON here instead of stdout")
+    ap.add_argument("--title-case-golden", action="store_true", help="Check title casing against the golden file and exit")
+    ap.add_argument("--update-title-case-golden", action="store_true", help="Regenerate the title casing golden file and exit")
+    ap.add_argument("--micro", action="store_true", help="Time text helpers against their baseline versions and exit")
+    ap.add_argument("sync_args", nargs=argparse.REMAINDER, help="Extra paper_parser.py args (after --)")
+    args = ap.parse_args()
+    sync_args = [a for a in args.sync_args if a != "--"]
+
+    if args.update_title_case_golden:
+        n = update_title_case_golden(TITLE_CASE_GOLDEN)
+        print(f"[BENCH] wrote {n} title casing cases to {TITLE_CASE_GOLDEN}", file=sys.stderr)
+        return
+    if args.title_case_golden:
+        res = check_title_case_golden(TITLE_CASE_GOLDEN)
+        print(json.dumps(res, indent=2, ensure_ascii=False))
+        if res["mismatches"]:
+            sys.exit(1)
+        return
+
+    if args.micro:
+        res = run_micro(REPO_ROOT, args.repeat)
+        res.update({"commit": git_commit(), "python": platform.python_version()})
+        print(json.dumps(res, indent=2, ensure_ascii=False))
+        if res["mismatches"]:
+            sys.exit(1)
+        return
+
+    if args.write_fixture_pages:
+        n = write_fixture_pages(REPO_ROOT, DEFAULT_FIXTURES)
+        print(f"[BENCH] wrote {n} works to {DEFAULT_FIXTURES}", file=sys.stderr)
+        return
+
+    if args.fixtures == "site":
+        base = site_corpus(REPO_ROOT)
+    else:
+        fixtures = Path(args.fixtures)
+        base = load_recorded_corpus(fixtures if fixtures.is_absolute() else REPO_ROOT / fixtures)
+    pi_id = _member_ids(REPO_ROOT).get("Marc Rußwurm", "")
+
+    results = []
+    for scale in args.scales:
+        corpus, synth = scale_corpus(base, pi_id, scale, seed=args.seed)
+        runs = [run_once(corpus, synth, sync_args, trace_memory=False) for _ in range(max(1, args.repeat))]
+        best = min(runs, key=lambda r: r["wall_s"])
+        if not args.no_memory:
+            best["peak_mem_bytes"] = run_once(corpus, synth, sync_args, trace_memory=True)["peak_mem_bytes"]
+        best.update({"scale": scale, "members": len(corpus.authors), "works": len(corpus.works)})
+        results.append(best)
+        print(f"[BENCH] scale {scale}: {len(corpus.works)} works, {best['wall_s']:.3f}s", file=sys.stderr)
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": args.fixtures,
+        "sync_args": sync_args,
+        "results": results,
+    }
+    txt = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(txt + "\n", encoding="utf-8")
+    else:
+        print(txt)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ Rules:
 
 Reads members from:     ./_members/*.md
 Writes publications to: ./_publications/*.md
+Also writes:            ./_data/publications.json, ./_includes/publications-list*.html,
+                        ./assets/js/lunr/publications-index.<hash>.json (optional `lunr` package)
 
 Member front matter recommended:
 ---
@@ -19,11 +21,12 @@ Publication output front matter:
 ---
 title: "Paper title"
 authors: "A, B, **Marc Rußwurm**, **Other Member**, D, et al."
+authors_html: "A, B, <strong>Marc Rußwurm</strong>, <strong>Other Member</strong>, D, et al."
 date: "2025-03-17"
 year: 2025
 link: "https://doi.org/..."
 venue: "NeurIPS"
-order: 1
+sort_key: "2025-03-17-W123..."   # date + work ID; --order-scheme sequential adds order: 1..N
 openalex_work_id: "W123..."
 dedupe_key: "doi:https://doi.org/..."
 ---
@@ -32,25 +35,67 @@ dedupe_key: "doi:https://doi.org/..."
 from __future__ import annotations
 
 import argparse
+import difflib
+import functools
+import gzip
+import hashlib
+import html
 import json
 import re
 import os
+import random
+import sys
+import threading
 import time
 import unicodedata
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import requests
 import yaml
 
 OPENALEX_API = "https://api.openalex.org"
+OPENALEX_MAX_OR_VALUES = 100  # max pipe-joined values per filter
+LIMIT_SORT = "publication_date:desc"  # order of every chain under --limit-works-per-member ("newest N")
+
+# The only work fields the helpers below read (requested via `select=`).
+# host_venue is gone from the current API (and rejected by select); pick_venue()
+# falls back to primary_location.source.
+WORK_SELECT_FIELDS = [
+    "id",
+    "doi",
+    "display_name",
+    "publication_date",
+    "publication_year",
+    "authorships",
+    "primary_location",
+    "cited_by_count",
+]
 
 
 # ----------------------------
 # Text / YAML helpers
 # ----------------------------
 
+_LINE_WS_RE = re.compile(r"[\r\n\t]+")
+_WS_RE = re.compile(r"\s+")
+_SLUG_SEP_RE = re.compile(r"[^a-z0-9]+")
+_SLUG_DASHES_RE = re.compile(r"-{2,}")
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_YEAR_RE = re.compile(r"\d{4}")
+
+# str.translate table deleting the control/format chars (Cc, Cf) of the BMP; the
+# rarer categories (Cs, Co, Cn, astral Cf) are caught by the isprintable() fallback.
+_CONTROL_CHARS = dict.fromkeys(
+    cp for cp in range(min(sys.maxunicode, 0xFFFF) + 1) if unicodedata.category(chr(cp)) in ("Cc", "Cf")
+)
+
+
 def sanitize_yaml_scalar(s: str) -> str:
     """
     Remove characters that can break YAML parsing in Jekyll (Psych),
@@ -62,24 +107,28 @@ def sanitize_yaml_scalar(s: str) -> str:
     s = s.replace("\u00A0", " ")  # NBSP
 
     # Replace line/tab whitespace with spaces
-    s = re.sub(r"[\r\n\t]+", " ", s)
+    s = _LINE_WS_RE.sub(" ", s)
 
     # Drop control/format chars (Unicode category starting with 'C')
     # This removes e.g. \u200b (ZWSP), bidi marks, etc.
-    s = "".join(ch for ch in s if unicodedata.category(ch)[0] != "C")
+    s = s.translate(_CONTROL_CHARS)
+    if not s.isprintable():
+        s = "".join(ch for ch in s if unicodedata.category(ch)[0] != "C")
 
     # Collapse whitespace
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WS_RE.sub(" ", s).strip()
     return s
 
 
+@functools.lru_cache(maxsize=8192)
 def norm_name(s: str) -> str:
     """Normalize names for matching (lowercase, strip accents, ß->ss, collapse whitespace)."""
-    s = (s or "").replace("ß", "ss")
-    s = unicodedata.normalize("NFKD", s)
-    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    s = s or ""
+    if not s.isascii():
+        s = unicodedata.normalize("NFKD", s.replace("ß", "ss"))
+        s = "".join(ch for ch in s if not unicodedata.combining(ch))
     s = s.lower()
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WS_RE.sub(" ", s).strip()
     return s
 
 
@@ -95,11 +144,29 @@ def slugify(s: str, max_len: int = 80) -> str:
     """ASCII-ish slug for filenames."""
     s = sanitize_yaml_scalar(s)
     s = norm_name(s)
-    s = re.sub(r"[^a-z0-9]+", "-", s).strip("-")
-    s = re.sub(r"-{2,}", "-", s)
+    s = _SLUG_SEP_RE.sub("-", s).strip("-")
+    s = _SLUG_DASHES_RE.sub("-", s)
     return (s[:max_len].strip("-") or "paper")
 
 
+# libyaml bindings when PyYAML was built with them (same results, ~10x faster)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def yaml_load(s: str) -> Any:
+    return yaml.load(s, Loader=_YAML_LOADER)
+
+
+def yaml_dump(obj: Any, **kwargs: Any) -> str:
+    """yaml.safe_dump() output, produced by libyaml where that is byte-identical."""
+    out = yaml.dump(obj, Dumper=_YAML_DUMPER, **kwargs)
+    if _YAML_DUMPER is not yaml.SafeDumper and "\\U" in out:
+        # libyaml escapes characters outside the BMP (emoji, math letters) where the Python emitter doesn't
+        out = yaml.safe_dump(obj, **kwargs)
+    return out
+
+
 def read_front_matter(md_path: Path) -> tuple[dict, str]:
     """Parse YAML front matter from a markdown file. Returns (front_matter_dict, body_text)."""
     txt = md_path.read_text(encoding="utf-8-sig")  # strips BOM
@@ -124,35 +191,499 @@ def read_front_matter(md_path: Path) -> tuple[dict, str]:
     i += 1  # skip closing delimiter
     fm_raw = "\n".join(fm_lines)
     body = "\n".join(lines[i:]).lstrip("\n")
-    fm = yaml.safe_load(fm_raw) or {}
+    fm = yaml_load(fm_raw) or {}
     return fm, body
 
 
-def write_front_matter_md(out_path: Path, fm: Dict[str, Any], body: str = "") -> None:
-    """
-    Write a Markdown file with YAML front matter using yaml.safe_dump.
-    Values are sanitized before dump to avoid Jekyll YAML parser issues.
-    """
-    def sanitize_obj(obj: Any) -> Any:
-        if isinstance(obj, str):
-            return sanitize_yaml_scalar(obj)
-        if isinstance(obj, dict):
-            return {k: sanitize_obj(v) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [sanitize_obj(v) for v in obj]
-        return obj
+def sanitize_front_matter(obj: Any) -> Any:
+    """Apply sanitize_yaml_scalar() to every string in a front matter structure."""
+    if isinstance(obj, str):
+        return sanitize_yaml_scalar(obj)
+    if isinstance(obj, dict):
+        return {k: sanitize_front_matter(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [sanitize_front_matter(v) for v in obj]
+    return obj
 
-    fm = sanitize_obj(fm)
 
-    yaml_txt = yaml.safe_dump(
-        fm,
+def dump_front_matter(fm: Dict[str, Any]) -> str:
+    return yaml_dump(
+        sanitize_front_matter(fm),
         sort_keys=False,
         allow_unicode=True,
         default_flow_style=False,
         width=120,
     ).strip()
 
-    out_path.write_text(f"---\n{yaml_txt}\n---\n{body}", encoding="utf-8")
+
+def _replace_text(path: Path, txt: str, tmp_tag: str = "") -> None:
+    """Write `txt` to a hidden temp file next to `path` and rename it over `path` (atomic on POSIX)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}{tmp_tag}.tmp")
+    tmp.write_text(txt, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def write_front_matter_md(out_path: Path, fm: Dict[str, Any], body: str = "") -> None:
+    """
+    Write a Markdown file with YAML front matter using yaml.safe_dump.
+    Values are sanitized before dump to avoid Jekyll YAML parser issues.
+    The file is replaced atomically (temp file + rename).
+    """
+    yaml_txt = dump_front_matter(fm)
+    _replace_text(out_path, f"---\n{yaml_txt}\n---\n{body}")
+
+
+def front_matter_differs(old: Dict[str, Any], new: Dict[str, Any]) -> bool:
+    """True if writing `new` would change what YAML loads back (formatting-only differences don't count)."""
+    return (yaml_load(dump_front_matter(new)) or {}) != old
+
+
+# ----------------------------
+# Publications index
+# ----------------------------
+
+PARALLEL_PARSE_MIN = 256  # cold files per directory before parsing moves to a process pool
+
+
+class FrontMatterCache:
+    """
+    Parsed front matter of Markdown files keyed by path, valid while the file's
+    mtime and size are unchanged. Kept in a JSON sidecar so warm runs parse
+    nothing; large cold directories are parsed in a process pool.
+    Shared by load_members() and PublicationsIndex.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Optional[Path] = None, workers: int = 0):
+        self.path = path
+        self.workers = workers or min(8, os.cpu_count() or 1)
+        self.parsed = 0
+        self.entries: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path or not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except ValueError:
+            return {}
+        if data.get("version") != self.VERSION:
+            return {}
+        return data.get("files") or {}
+
+    @staticmethod
+    def _fresh(e: Optional[Dict[str, Any]], st: os.stat_result) -> bool:
+        return bool(e) and e.get("mtime_ns") == st.st_mtime_ns and e.get("size") == st.st_size
+
+    def _store(self, p: Path, st: os.stat_result, fm: Any, body: str) -> Dict[str, Any]:
+        self.parsed += 1
+        e = self.entries[str(p)] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "fm": fm if isinstance(fm, dict) else {},
+            "body": body,
+        }
+        return e
+
+    def get(self, p: Path, st: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """Entry {mtime_ns, size, fm, body} for one file, parsed only if it changed."""
+        st = st or p.stat()
+        e = self.entries.get(str(p))
+        if self._fresh(e, st):
+            return e
+        fm, body = read_front_matter(p)
+        return self._store(p, st, fm, body)
+
+    def load_dir(self, d: Path, pattern: str = "*.md") -> Dict[str, Dict[str, Any]]:
+        """Entries for every file in a directory (filename -> entry, sorted by name)."""
+        files = [(p, p.stat()) for p in sorted(d.glob(pattern))]
+        stale = [(p, st) for p, st in files if not self._fresh(self.entries.get(str(p)), st)]
+        if len(stale) >= PARALLEL_PARSE_MIN and self.workers > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                parsed = pool.map(read_front_matter, [p for p, _ in stale], chunksize=64)
+                for (p, st), (fm, body) in zip(stale, parsed):
+                    self._store(p, st, fm, body)
+        return {p.name: self.get(p, st) for p, st in files}
+
+    def forget(self, p: Path) -> None:
+        self.entries.pop(str(p), None)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        files: Dict[str, Dict[str, Any]] = {}
+        for key, e in self.entries.items():
+            if not os.path.exists(key):
+                continue
+            try:
+                json.dumps(e)
+            except (TypeError, ValueError):
+                continue  # e.g. unquoted YAML dates; re-parsed next run
+            files[key] = e
+        _replace_text(self.path, json.dumps({"version": self.VERSION, "files": files}))
+
+
+class PublicationsIndex:
+    """
+    Parsed front matter of every _publications/*.md, built once per run from a
+    FrontMatterCache: a file is re-parsed only when its mtime or size changed.
+    Lookups by openalex_work_id, dedupe_key and title_key_lower() return filenames.
+    """
+
+    def __init__(self, pubs_dir: Path, sidecar: Optional[Path] = None, cache: Optional[FrontMatterCache] = None):
+        self.pubs_dir = pubs_dir
+        self.cache = cache or FrontMatterCache(sidecar)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.parsed = 0
+        self.by_work_id: Dict[str, List[str]] = {}
+        self.by_dedupe_key: Dict[str, List[str]] = {}
+        self.by_title: Dict[str, List[str]] = {}
+        self._build()
+
+    def _build(self) -> None:
+        before = self.cache.parsed
+        self.entries = self.cache.load_dir(self.pubs_dir)
+        self.parsed += self.cache.parsed - before
+        self._reindex()
+
+    def _parse(self, p: Path) -> None:
+        # always re-read: a rewrite can keep both size and (coarse) mtime
+        self.cache.forget(p)
+        self.entries[p.name] = self.cache.get(p)
+        self.parsed += 1
+
+    def _keys(self, name: str) -> List[Tuple[Dict[str, List[str]], str]]:
+        fm = self.entries[name]["fm"]
+        keys = []
+        if fm.get("openalex_work_id"):
+            keys.append((self.by_work_id, str(fm["openalex_work_id"])))
+        if fm.get("dedupe_key"):
+            keys.append((self.by_dedupe_key, str(fm["dedupe_key"])))
+        title = fm.get("title")
+        if isinstance(title, str) and title.strip():
+            keys.append((self.by_title, title_key_lower(title)))
+        return keys
+
+    def _index(self, name: str) -> None:
+        for lookup, k in self._keys(name):
+            lookup.setdefault(k, []).append(name)
+
+    def _unindex(self, name: str) -> None:
+        for lookup, k in self._keys(name):
+            names = lookup.get(k) or []
+            if name in names:
+                names.remove(name)
+            if not names:
+                lookup.pop(k, None)
+
+    def _reindex(self) -> None:
+        self.by_work_id, self.by_dedupe_key, self.by_title = {}, {}, {}
+        for name in self.entries:
+            self._index(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def names(self) -> List[str]:
+        return sorted(self.entries)
+
+    def front_matter(self, name: str) -> Tuple[Dict[str, Any], str]:
+        e = self.entries[name]
+        return e["fm"], e["body"]
+
+    def refresh(self, path: Path) -> None:
+        """Re-read one file after it was written."""
+        if path.name in self.entries:
+            self._unindex(path.name)
+        self._parse(path)
+        self._index(path.name)
+
+    def remove(self, path: Path) -> None:
+        self.cache.forget(path)
+        if path.name in self.entries:
+            self._unindex(path.name)
+            del self.entries[path.name]
+
+    def save(self) -> None:
+        self.cache.save()
+
+
+def upsert_publication(
+    pubs_dir: Path,
+    index: PublicationsIndex,
+    fname: str,
+    fm: Dict[str, Any],
+    drop_keys: Iterable[str] = (),
+) -> Tuple[str, str]:
+    """
+    Create or update the file for one work, matched by openalex_work_id, then dedupe_key.
+    Keys not computed by the sync (manual additions) and the body are preserved;
+    `drop_keys` are sync keys that are no longer written and get removed.
+    Returns (status, filename); status is created / updated / renamed / unchanged.
+    """
+    wid = str(fm.get("openalex_work_id") or "")
+    dkey = str(fm.get("dedupe_key") or "")
+    matches = index.by_work_id.get(wid) or index.by_dedupe_key.get(dkey) or ([fname] if fname in index else [])
+
+    out_path = pubs_dir / fname
+    if not matches:
+        write_front_matter_md(out_path, fm, body="")
+        index.refresh(out_path)
+        return "created", fname
+
+    old_name = fname if fname in matches else matches[0]
+    old_fm, body = index.front_matter(old_name)
+    new_fm = {**old_fm, **fm}
+    for k in drop_keys:
+        if k not in fm:
+            new_fm.pop(k, None)
+
+    if old_name != fname:
+        write_front_matter_md(out_path, new_fm, body=body)
+        index.refresh(out_path)
+        old_path = pubs_dir / old_name
+        old_path.unlink()
+        index.remove(old_path)
+        return "renamed", fname
+
+    if front_matter_differs(old_fm, new_fm):
+        write_front_matter_md(out_path, new_fm, body=body)
+        index.refresh(out_path)
+        return "updated", fname
+
+    return "unchanged", fname
+
+
+def delete_stale_publications(pubs_dir: Path, index: PublicationsIndex, keep: set[str]) -> int:
+    """Delete synced files (those with an openalex_work_id) that are not in `keep` (filenames)."""
+    deleted = 0
+    for names in list(index.by_work_id.values()):
+        for name in list(names):
+            if name not in keep:
+                p = pubs_dir / name
+                p.unlink()
+                index.remove(p)
+                deleted += 1
+    return deleted
+
+
+# ----------------------------
+# Snapshot export (_data/publications.json)
+# ----------------------------
+
+def work_members(work: "PublicationRecord", members: List[Member]) -> List[Member]:
+    """Group members on a work (by OpenAlex author ID, else normalized name), in author order."""
+    by_id = {canonical_openalex_id(m.openalex_author_id).upper(): m for m in members if m.openalex_author_id}
+    by_norm = {m.name_norm: m for m in members}
+    found: Dict[str, Member] = {}
+    for aid, norm in zip(work.author_ids, work.author_name_norms):
+        m = by_id.get(aid.upper()) or by_norm.get(norm)
+        if m is not None:
+            found.setdefault(m.name_norm, m)
+    return list(found.values())
+
+
+def export_snapshot(path: Path, records: List[Dict[str, Any]]) -> Tuple[bool, Dict[str, int]]:
+    """
+    Write all kept publications to one JSON file (Jekyll: site.data.publications),
+    one record per line so it diffs well. The file is only replaced when its
+    content changes. Returns (written, {added, removed, changed} vs the previous snapshot).
+    """
+    txt = "[\n" + ",\n".join(json.dumps(r, ensure_ascii=False, sort_keys=True) for r in records) + "\n]\n"
+    old_txt = path.read_text(encoding="utf-8") if path.exists() else ""
+    if txt == old_txt:
+        return False, {"added": 0, "removed": 0, "changed": 0}
+
+    try:
+        old = {r.get("openalex_work_id"): r for r in json.loads(old_txt)} if old_txt else {}
+    except ValueError:
+        old = {}
+    new = {r.get("openalex_work_id"): r for r in records}
+    diff = {
+        "added": len(new.keys() - old.keys()),
+        "removed": len(old.keys() - new.keys()),
+        "changed": sum(1 for k in new.keys() & old.keys() if new[k] != old[k]),
+    }
+
+    _replace_text(path, txt)
+    return True, diff
+
+
+# ----------------------------
+# Pre-rendered publication lists (_includes/publications-list*.html)
+# ----------------------------
+
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+
+
+def authors_to_html(authors: str) -> str:
+    """format_authors() output as HTML: escaped names, **member** -> <strong>member</strong>."""
+    return _BOLD_RE.sub(r"<strong>\1</strong>", html.escape(authors, quote=False))
+
+
+def render_publications_list(entries: List[Dict[str, Any]]) -> str:
+    """The papers-list markup research.md / the home layout used to build in Liquid, for front matter dicts."""
+    lines = ["<!-- Generated by paper_parser.py from _publications; do not edit. -->", '<ul class="papers-list">']
+    for fm in entries:
+        authors_html = fm.get("authors_html")
+        if not isinstance(authors_html, str):
+            authors_html = authors_to_html(str(fm.get("authors") or ""))
+        year = f" ({html.escape(str(fm['year']), quote=False)})" if fm.get("year") else ""
+        lines += [
+            '  <li class="papers-list__item">',
+            f'    <span class="papers-list__authors">{authors_html}</span>',
+            f'    <span class="papers-list__title"><a href="{html.escape(str(fm.get("link") or ""))}" target="_blank" '
+            f'rel="noopener">{html.escape(str(fm.get("title") or ""), quote=False)}</a></span>',
+            f'    <span class="papers-list__venue">— {html.escape(str(fm.get("venue") or ""), quote=False)}{year}</span>',
+            "  </li>",
+        ]
+    lines.append("</ul>")
+    return "\n".join(lines) + "\n"
+
+
+def publications_newest_first(index: PublicationsIndex) -> List[Tuple[str, Dict[str, Any]]]:
+    """(filename, front matter) of every publication, descending by sort_key; files without one last."""
+    items = [(name, index.front_matter(name)[0]) for name in index.names()]
+    with_key = sorted((it for it in items if it[1].get("sort_key")), key=lambda it: str(it[1]["sort_key"]), reverse=True)
+    return with_key + [it for it in items if not it[1].get("sort_key")]
+
+
+def write_publications_includes(path: Path, index: PublicationsIndex, recent: int = 5) -> int:
+    """
+    Write every publication in the index, newest first by sort_key, to `path`,
+    and the first `recent` of them to `<stem>-recent.html` next to it, so the
+    site needs no per-paper sort or markdownify. Files without a sort_key come
+    last, like Liquid's `sort | reverse`. Unchanged files are not rewritten.
+    Returns the number of files written.
+    """
+    ordered = [fm for _name, fm in publications_newest_first(index)]
+    written = 0
+    for out, entries in ((path, ordered), (path.with_name(f"{path.stem}-recent{path.suffix}"), ordered[:recent])):
+        txt = render_publications_list(entries)
+        if not out.exists() or out.read_text(encoding="utf-8") != txt:
+            _replace_text(out, txt)
+            written += 1
+    return written
+
+
+# ----------------------------
+# Prebuilt lunr search index (assets/js/lunr/publications-index.<hash>.json)
+# ----------------------------
+
+SEARCH_INDEX_PREFIX = "publications-index"
+SEARCH_LOADER_NAME = "publications-search.js"
+SEARCH_INDEX_FORMAT = 2  # part of the file hash: bump when the serialized layout changes
+
+# Jekyll renders this (layout: none) so relative_url resolves; %s is the versioned index filename.
+SEARCH_LOADER_TEMPLATE = """---
+layout: none
+---
+// Generated by paper_parser.py; do not edit.
+// loadPublicationsSearch() resolves to {index: lunr.Index, store: {ref: {title, link, authors_html, venue, year}}},
+// store values HTML-escaped. lunr-en.js / lunr-gr.js query it next to their in-browser index.
+var loadPublicationsSearch = (function () {
+  var pending = null;
+  return function () {
+    if (!pending) {
+      pending = fetch("{{ '/assets/js/lunr/%s' | relative_url }}")
+        .then(function (response) { return response.json(); })
+        .then(function (data) { return {index: lunr.Index.load(data.index), store: data.store}; });
+    }
+    return pending;
+  };
+})();
+"""
+
+
+def search_documents(index: PublicationsIndex) -> List[Dict[str, str]]:
+    """One lunr document per publication: ref (work ID, else filename) plus the searchable and display fields."""
+    docs = []
+    for name, fm in publications_newest_first(index):
+        authors = str(fm.get("authors") or "")
+        authors_html = fm.get("authors_html")
+        docs.append({
+            "ref": str(fm.get("openalex_work_id") or name),
+            "title": str(fm.get("title") or ""),
+            "authors": authors.replace("**", ""),
+            "authors_html": authors_html if isinstance(authors_html, str) else authors_to_html(authors),
+            "venue": str(fm.get("venue") or ""),
+            "year": str(fm.get("year") or ""),
+            "link": str(fm.get("link") or ""),
+        })
+    return docs
+
+
+def write_search_index(out_dir: Path, index: PublicationsIndex) -> Optional[bool]:
+    """
+    Serialize a lunr.js 2.x index over title, authors, venue and year to
+    <out_dir>/publications-index.<hash>.json (hash of the indexed documents),
+    and point publications-search.js at it; the theme's lunr-en.js / lunr-gr.js
+    query it instead of indexing the collection in the browser (_config.yml sets
+    search: false for publications). Nothing is built when a file for the
+    current publication set already exists; older versions are removed.
+    Returns None when the optional `lunr` package is missing, else whether files changed.
+    """
+    try:
+        from lunr import lunr
+    except ImportError:
+        return None
+
+    docs = search_documents(index)
+    payload = json.dumps([SEARCH_INDEX_FORMAT, docs], ensure_ascii=False, sort_keys=True)
+    digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+    fname = f"{SEARCH_INDEX_PREFIX}.{digest}.json"
+    out = out_dir / fname
+    loader = out_dir / SEARCH_LOADER_NAME
+    loader_txt = SEARCH_LOADER_TEMPLATE % fname
+
+    changed = False
+    if not out.exists():
+        idx = lunr(
+            ref="ref",
+            fields=[dict(field_name="title", boost=10), "authors", "venue", "year"],
+            documents=docs,
+        )
+        # ready to concatenate into result markup (authors_html already is)
+        store = {
+            d["ref"]: {
+                "title": html.escape(d["title"], quote=False),
+                "link": html.escape(d["link"]),
+                "authors_html": d["authors_html"],
+                "venue": html.escape(d["venue"], quote=False),
+                "year": html.escape(d["year"], quote=False),
+            }
+            for d in docs
+        }
+        _replace_text(out, json.dumps({"index": idx.serialize(), "store": store}, ensure_ascii=False, separators=(",", ":")))
+        changed = True
+    if not loader.exists() or loader.read_text(encoding="utf-8") != loader_txt:
+        _replace_text(loader, loader_txt)
+        changed = True
+    for old in out_dir.glob(f"{SEARCH_INDEX_PREFIX}.*.json"):
+        if old.name != fname:
+            old.unlink()
+            changed = True
+    return changed
+
+
+def write_publication_assets(args: argparse.Namespace, repo: Path, index: PublicationsIndex, stats: SyncStats) -> None:
+    """Site files derived from the whole collection: list includes and the search index."""
+    if args.publications_include:
+        with stats.stage("includes"):
+            stats.files_written += write_publications_includes(
+                repo / args.publications_include, index, recent=args.recent_publications
+            )
+
+    if args.search_index_dir:
+        with stats.stage("search_index"):
+            changed = write_search_index(repo / args.search_index_dir, index)
+            if changed is None:
+                print("[INFO] Skipping the publications search index: install the optional 'lunr' package to build it.")
+            elif changed:
+                stats.files_written += 1
+                print(f"[INFO] Rebuilt publications search index in {args.search_index_dir}.")
 
 
 # ----------------------------
@@ -164,23 +695,30 @@ SMALL_WORDS = {
     "of", "on", "onto", "or", "over", "per", "the", "to", "up", "via", "vs", "with", "within", "without",
 }
 
+# A sanitized title is words separated by single spaces; each word token is
+# scanned once into (leading punctuation, core, trailing punctuation) and its
+# core split on dashes/slashes into parts.
+_HAS_ALNUM_RE = re.compile(r"[^\W_]")
+_TOKEN_AFFIX_RE = re.compile(r"(\W*)(.*?)(\W*)")
+_PART_SEP_RE = re.compile(r"([-–—/])")
+_PART_SEPS = frozenset({"-", "–", "—", "/"})
+_INNER_CAPS_RE = re.compile(r"[A-Z].*[A-Z]|[a-z][A-Z]")
+_CAP_AFTER = (":", "—", "–")
+
 
 def _should_preserve_token_case(s: str) -> bool:
     """Preserve original capitalization for acronyms, camelCase, dotted abbreviations, or digits."""
     if not s:
         return False
-    if any(ch.isdigit() for ch in s):
-        return True
-    if "." in s:  # e.g., U.S., S.V.M.
-        return True
-    if s.isupper():  # e.g., CNN, NASA
-        return True
-    # internal caps: e.g., OpenAI, NeRF, eDNA
-    if re.search(r"[A-Z].*[A-Z]", s) and not re.fullmatch(r"[A-Z][a-z]+", s):
-        return True
-    if re.search(r"[a-z][A-Z]", s):
-        return True
-    return False
+    if s.isalpha():
+        # CNN, NASA; internal caps: OpenAI, NeRF, eDNA
+        return s.isupper() or _INNER_CAPS_RE.search(s) is not None
+    return (
+        any(ch.isdigit() for ch in s)
+        or "." in s  # e.g., U.S., S.V.M.
+        or s.isupper()
+        or _INNER_CAPS_RE.search(s) is not None
+    )
 
 
 def _titlecase_word(word: str, force_cap: bool) -> str:
@@ -196,6 +734,28 @@ def _titlecase_word(word: str, force_cap: bool) -> str:
     return lower[:1].upper() + lower[1:]
 
 
+@functools.lru_cache(maxsize=65536)
+def _titlecase_token(tok: str, force_cap: bool) -> str:
+    """Title-case one space-free word token; parts of a hyphenated/slashed word are cased separately."""
+    lead, core, trail = _TOKEN_AFFIX_RE.fullmatch(tok).groups()
+    parts = _PART_SEP_RE.split(core)
+    if len(parts) == 1:
+        # a lone part is both the first and the last part of its word
+        return f"{lead}{_titlecase_word(core, True)}{trail}"
+
+    word_part_positions = [j for j, p in enumerate(parts) if p and p not in _PART_SEPS]
+    wp_first = word_part_positions[0] if word_part_positions else -1
+    wp_last = word_part_positions[-1] if word_part_positions else -1
+
+    new_parts: List[str] = []
+    for j, p in enumerate(parts):
+        if not p or p in _PART_SEPS:
+            new_parts.append(p)
+            continue
+        new_parts.append(_titlecase_word(p, force_cap=force_cap or j == wp_first or j == wp_last))
+    return f"{lead}{''.join(new_parts)}{trail}"
+
+
 def title_case_paper_title(title: str) -> str:
     """
     Title case for paper titles:
@@ -207,71 +767,54 @@ def title_case_paper_title(title: str) -> str:
     """
     title = sanitize_yaml_scalar(title)
 
-    tokens = re.split(r"(\s+)", title)
-
-    def is_word_token(tok: str) -> bool:
-        core = re.sub(r"^\W+|\W+$", "", tok)
-        return any(ch.isalnum() for ch in core)
-
-    word_positions = [i for i, t in enumerate(tokens) if t and (not t.isspace()) and is_word_token(t)]
-    if not word_positions:
+    tokens = title.split(" ")
+    is_word = [_HAS_ALNUM_RE.search(t) is not None for t in tokens]
+    if not any(is_word):
         return title
 
-    first_pos = word_positions[0]
-    last_pos = word_positions[-1]
+    first_pos = is_word.index(True)
+    last_pos = len(is_word) - 1 - is_word[::-1].index(True)
 
     cap_next = True
     out: List[str] = []
-
     for i, tok in enumerate(tokens):
-        if not tok or tok.isspace() or not is_word_token(tok):
+        if not is_word[i]:
             out.append(tok)
-            if tok and tok.strip().endswith((":","—","–")):
+            if tok.endswith(_CAP_AFTER):
                 cap_next = True
             continue
 
-        m_lead = re.match(r"^\W*", tok)
-        m_trail = re.search(r"\W*$", tok)
-        lead = m_lead.group(0) if m_lead else ""
-        trail = m_trail.group(0) if m_trail else ""
-        core = tok[len(lead):len(tok) - len(trail)] if len(tok) >= (len(lead) + len(trail)) else tok
+        out.append(_titlecase_token(tok, cap_next or i == first_pos or i == last_pos))
+        cap_next = tok.endswith(_CAP_AFTER)
 
-        is_first_or_last = (i == first_pos) or (i == last_pos)
-        force_cap_word = cap_next or is_first_or_last
+    return " ".join(out)
 
-        parts = re.split(r"([-–—/])", core)
-        word_part_positions = [j for j, p in enumerate(parts) if p and p not in {"-", "–", "—", "/"}]
-        wp_first = word_part_positions[0] if word_part_positions else -1
-        wp_last = word_part_positions[-1] if word_part_positions else -1
-
-        new_parts: List[str] = []
-        for j, p in enumerate(parts):
-            if p in {"-", "–", "—", "/"} or not p:
-                new_parts.append(p)
-                continue
-            force_cap_part = force_cap_word or (j == wp_first) or (j == wp_last)
-            new_parts.append(_titlecase_word(p, force_cap=force_cap_part))
 
-        new_core = "".join(new_parts)
-        out.append(f"{lead}{new_core}{trail}")
-
-        cap_next = tok.rstrip().endswith((":","—","–"))
-
-    return "".join(out)
+def title_case_many(titles: Iterable[str]) -> List[str]:
+    """title_case_paper_title() for many titles; repeated titles are cased once (words are memoized too)."""
+    done: Dict[str, str] = {}
+    out: List[str] = []
+    for t in titles:
+        cased = done.get(t)
+        if cased is None:
+            cased = done[t] = title_case_paper_title(t)
+        out.append(cased)
+    return out
 
 
-def harmonize_publication_titles_in_dir(pubs_dir: Path) -> int:
+def harmonize_publication_titles_in_dir(pubs_dir: Path, index: Optional[PublicationsIndex] = None) -> int:
     """Rewrite existing _publications/*.md so fm['title'] uses title_case_paper_title()."""
+    index = index or PublicationsIndex(pubs_dir)
+    titled = [name for name in index.names() if isinstance(index.front_matter(name)[0].get("title"), str)]
+    cased = title_case_many(index.front_matter(name)[0]["title"] for name in titled)
     updated = 0
-    for p in sorted(pubs_dir.glob("*.md")):
-        fm, body = read_front_matter(p)
-        if not isinstance(fm, dict) or "title" not in fm or not isinstance(fm["title"], str):
-            continue
-        old = fm["title"]
-        new = title_case_paper_title(old)
-        if new != old:
-            fm["title"] = new
+    for name, new in zip(titled, cased):
+        fm, body = index.front_matter(name)
+        if new != fm["title"]:
+            fm = dict(fm, title=new)
+            p = pubs_dir / name
             write_front_matter_md(p, fm, body=body)
+            index.refresh(p)
             updated += 1
     return updated
 
@@ -282,16 +825,15 @@ def harmonize_publication_titles_in_dir(pubs_dir: Path) -> int:
 
 def title_key_lower(s: str) -> str:
     """Case-insensitive title key (sanitize + collapse whitespace + lowercase)."""
-    s = sanitize_yaml_scalar(s or "")
-    s = re.sub(r"\s+", " ", s).strip().lower()
-    return s
+    # sanitize_yaml_scalar() already collapses and strips whitespace
+    return sanitize_yaml_scalar(s or "").lower()
 
 
-def dedupe_works_by_title_lower(works: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def dedupe_works_by_title_lower(works: List[Work]) -> List[Work]:
     """Keep one work per identical lowercase title; keep best by work_quality_key()."""
-    best: Dict[str, Dict[str, Any]] = {}
+    best: Dict[str, Work] = {}
     for w in works:
-        t = title_key_lower(w.get("display_name") or "")
+        t = w.title_key if isinstance(w, PublicationRecord) else title_key_lower(w.get("display_name") or "")
         if not t:
             continue
         prev = best.get(t)
@@ -300,46 +842,65 @@ def dedupe_works_by_title_lower(works: List[Dict[str, Any]]) -> List[Dict[str, A
     return list(best.values())
 
 
-def prune_publications_with_identical_titles(pubs_dir: Path) -> int:
+def prune_publications_with_identical_titles(pubs_dir: Path, index: Optional[PublicationsIndex] = None) -> int:
     """
     Delete duplicate publication MD files that have identical lowercase front-matter titles.
     Keep the newest by date, tie-breaker: shorter filename.
     """
-    groups: Dict[str, List[Path]] = {}
-
-    for p in pubs_dir.glob("*.md"):
-        fm, _body = read_front_matter(p)
-        title = fm.get("title") if isinstance(fm, dict) else None
-        if not isinstance(title, str) or not title.strip():
-            continue
-        k = title_key_lower(title)
-        groups.setdefault(k, []).append(p)
+    index = index or PublicationsIndex(pubs_dir)
 
     deleted = 0
-    for _k, files in groups.items():
-        if len(files) <= 1:
+    for _k, names in list(index.by_title.items()):
+        if len(names) <= 1:
             continue
 
-        def score(path: Path) -> Tuple[str, int]:
-            fm, _ = read_front_matter(path)
-            date = str((fm or {}).get("date") or "")
-            return (date, -len(path.name))
+        def score(name: str) -> Tuple[str, int]:
+            fm, _ = index.front_matter(name)
+            date = str(fm.get("date") or "")
+            return (date, -len(name))
 
-        keep = max(files, key=score)
-        for f in files:
-            if f != keep:
-                f.unlink()
-                deleted += 1
+        keep = max(names, key=score)
+        # index.remove() edits `names` (the index's own list), so collect first
+        for name in [n for n in names if n != keep]:
+            p = pubs_dir / name
+            p.unlink()
+            index.remove(p)
+            deleted += 1
 
     return deleted
 
 
+def prune_superseded_publications(
+    pubs_dir: Path,
+    superseded: Dict[str, str],
+    index: Optional[PublicationsIndex] = None,
+) -> int:
+    """Delete publication MD files whose openalex_work_id was merged into another work (see fuzzy_dedupe_works)."""
+    if not superseded:
+        return 0
+    index = index or PublicationsIndex(pubs_dir)
+
+    deleted = 0
+    for wid, kept_wid in superseded.items():
+        # never delete the only file of the surviving work
+        if not index.by_work_id.get(kept_wid):
+            continue
+        for name in list(index.by_work_id.get(wid) or []):
+            p = pubs_dir / name
+            p.unlink()
+            index.remove(p)
+            deleted += 1
+    return deleted
+
+
 # ----------------------------
 # OpenAlex helpers
 # ----------------------------
 
-def normalized_doi(work: Dict[str, Any]) -> str:
+def normalized_doi(work: Work) -> str:
     """Normalize DOI to lowercase doi.org URL if present."""
+    if isinstance(work, PublicationRecord):
+        return work.doi
     doi = (work.get("doi") or "").strip()
     if not doi:
         return ""
@@ -348,8 +909,10 @@ def normalized_doi(work: Dict[str, Any]) -> str:
     return f"https://doi.org/{doi}".lower()
 
 
-def pick_best_link(work: Dict[str, Any]) -> str:
+def pick_best_link(work: Work) -> str:
     """Prefer DOI; else landing page; else OpenAlex work URL."""
+    if isinstance(work, PublicationRecord):
+        return work.link
     doi = work.get("doi")
     if doi:
         doi = str(doi).strip()
@@ -365,8 +928,10 @@ def pick_best_link(work: Dict[str, Any]) -> str:
     return str(work.get("id") or "").strip()
 
 
-def pick_venue(work: Dict[str, Any]) -> str:
+def pick_venue(work: Work) -> str:
     """Prefer host_venue.display_name; else primary_location.source.display_name; else Unknown."""
+    if isinstance(work, PublicationRecord):
+        return work.venue
     hv = work.get("host_venue") or {}
     if hv.get("display_name"):
         return str(hv["display_name"]).strip()
@@ -379,24 +944,31 @@ def pick_venue(work: Dict[str, Any]) -> str:
     return ""
 
 
-def publication_date_yyyy_mm_dd(work: Dict[str, Any]) -> str:
+def publication_date_yyyy_mm_dd(work: Work) -> str:
     """
     OpenAlex often provides publication_date = 'YYYY-MM-DD'.
     If missing, fall back to 'YYYY-01-01' if year known, else '0000-01-01'.
     """
+    if isinstance(work, PublicationRecord):
+        return work.date_full
     d = str(work.get("publication_date") or "").strip()
-    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", d):
+    if _DATE_RE.fullmatch(d):
         return d
 
     y = str(work.get("publication_year") or "").strip()
-    if re.fullmatch(r"\d{4}", y):
+    if _YEAR_RE.fullmatch(y):
         return f"{y}-01-01"
 
     return ""
 
 
-def work_has_author(work: Dict[str, Any], author_ids: set[str], author_name_norm: str) -> bool:
+def work_has_author(work: Work, author_ids: set[str], author_name_norm: str) -> bool:
     """True if work includes given author by OpenAlex ID or normalized display name."""
+    if isinstance(work, PublicationRecord):
+        return any(
+            (aid and aid in author_ids) or (disp and nn == author_name_norm)
+            for aid, disp, nn in zip(work.author_ids, work.author_names, work.author_name_norms)
+        )
     for a in (work.get("authorships") or []):
         author = a.get("author") or {}
         aid = canonical_openalex_id(author.get("id") or "")
@@ -408,22 +980,66 @@ def work_has_author(work: Dict[str, Any], author_ids: set[str], author_name_norm
     return False
 
 
+def compact_work(work: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce an OpenAlex work to the fields the pipeline reads (see WORK_SELECT_FIELDS),
+    with authorships/locations cut down to ids and display names.
+    """
+    out: Dict[str, Any] = {
+        k: work.get(k)
+        for k in ("id", "doi", "display_name", "publication_date", "publication_year", "cited_by_count")
+    }
+    out["authorships"] = [
+        {"author": {"id": (a.get("author") or {}).get("id"), "display_name": (a.get("author") or {}).get("display_name")}}
+        for a in (work.get("authorships") or [])
+    ]
+    primary = work.get("primary_location") or {}
+    src = primary.get("source") or {}
+    out["primary_location"] = {
+        "landing_page_url": primary.get("landing_page_url"),
+        "source": {"display_name": src.get("display_name"), "type": src.get("type")} if src else None,
+    }
+    hv = work.get("host_venue") or {}
+    if hv.get("display_name"):
+        out["host_venue"] = {"display_name": hv["display_name"]}
+    return out
+
+
+def work_author_ids(work: Work) -> set[str]:
+    """Upper-cased short OpenAlex author IDs on a work (member IDs in front matter may be lowercase)."""
+    if isinstance(work, PublicationRecord):
+        return {aid.upper() for aid in work.author_ids if aid}
+    ids = set()
+    for a in (work.get("authorships") or []):
+        aid = canonical_openalex_id((a.get("author") or {}).get("id") or "")
+        if aid:
+            ids.add(aid.upper())
+    return ids
+
+
 def format_authors(
-    authorships: List[Dict[str, Any]],
+    authorships: Union[List[Dict[str, Any]], PublicationRecord],
     member_name_norms: set[str],
     member_author_ids: set[str],
     max_authors: int = 12,
 ) -> str:
-    """Format authors list; bold group members matched by OpenAlex author id or normalized name."""
+    """
+    Format authors list; bold group members matched by OpenAlex author id or normalized name.
+    `authorships` is a work's authorships list or a PublicationRecord.
+    """
+    if isinstance(authorships, PublicationRecord):
+        triples: Iterable[Tuple[str, str, str]] = zip(
+            authorships.author_ids, authorships.author_names, authorships.author_name_norms
+        )
+    else:
+        triples = (_authorship_triple(a) for a in authorships)
+
     names: List[str] = []
-    for a in authorships:
-        author = a.get("author") or {}
-        aid = canonical_openalex_id(author.get("id") or "")
-        disp = (author.get("display_name") or "").strip()
+    for aid, disp, disp_norm in triples:
         if not disp:
             continue
 
-        is_member = (aid and aid in member_author_ids) or (norm_name(disp) in member_name_norms)
+        is_member = (aid and aid in member_author_ids) or (disp_norm in member_name_norms)
         names.append(f"**{disp}**" if is_member else disp)
 
     if len(names) > max_authors:
@@ -432,33 +1048,79 @@ def format_authors(
     return ", ".join(names)
 
 
-def work_sort_key(w: Dict[str, Any]) -> Tuple[int, str]:
+def work_sort_key(w: Work) -> Tuple[int, str]:
     """Newest-first sort: (year, publication_date)."""
+    if isinstance(w, PublicationRecord):
+        return w.sort_key
     year = int(w.get("publication_year") or 0)
     date = str(w.get("publication_date") or "")
     return (year, date)
 
 
-def work_quality_key(work: Dict[str, Any]) -> tuple:
+def publication_sort_key(date_full: str, work_id: str) -> str:
+    """
+    Newest-first display key: 'YYYY-MM-DD-W…', sorted descending by the site.
+    Depends only on the work itself, so inserting a paper never changes another file.
+    """
+    return f"{date_full or '0000-01-01'}-{work_id}"
+
+
+# Preprint servers / archives: a record hosted there is not the published version.
+_PREPRINT_SOURCE_RE = re.compile(
+    r"\b(arxiv|biorxiv|medrxiv|chemrxiv|eartharxiv|ssrn|zenodo|research square|preprints\.org|essoar|egusphere|hal)\b", re.I
+)
+# DOIs minted by preprint servers / repositories (arXiv, Zenodo, SSRN, Research Square, Preprints.org, ESSOAr,
+# EarthArXiv, EGUsphere)
+_PREPRINT_DOI_PREFIXES = tuple(
+    f"https://doi.org/{p}"
+    for p in (
+        "10.48550/", "10.5281/", "10.2139/", "10.21203/", "10.20944/", "10.1002/essoar.", "10.31223/",
+        "10.5194/egusphere-",
+    )
+)
+
+
+def work_has_published_venue(work: Dict[str, Any]) -> bool:
+    """True if the work's venue is a journal/conference/book, not a preprint repository."""
+    primary = work.get("primary_location") or {}
+    src = primary.get("source") or {}
+    name = str((work.get("host_venue") or {}).get("display_name") or src.get("display_name") or "").strip()
+    if not name or src.get("type") == "repository" or _PREPRINT_SOURCE_RE.search(name):
+        return False
+    return not normalized_doi(work).startswith(_PREPRINT_DOI_PREFIXES)
+
+
+def work_is_published(work: Work) -> bool:
+    """Published record: a non-repository venue, or a DOI not minted by a preprint server."""
+    has_venue = work.quality_key[0] if isinstance(work, PublicationRecord) else work_has_published_venue(work)
+    doi = normalized_doi(work)
+    return bool(has_venue) or bool(doi and not doi.startswith(_PREPRINT_DOI_PREFIXES))
+
+
+def work_quality_key(work: Work) -> tuple:
     """
     Prefer the more “complete/official” record when deduping:
-    DOI > venue > date > citations > author count.
+    published venue > DOI > date > citations > author count.
+    Preprints carry DOIs too (arXiv, Zenodo), so the venue decides preprint vs published.
     """
-    hv = (work.get("host_venue") or {}).get("display_name") or ""
-    has_venue = 1 if str(hv).strip() else 0
+    if isinstance(work, PublicationRecord):
+        return work.quality_key
+    has_venue = 1 if work_has_published_venue(work) else 0
     has_date = 1 if str(work.get("publication_date") or "").strip() else 0
     has_doi = 1 if normalized_doi(work) else 0
     cited_by = int(work.get("cited_by_count") or 0)
     n_auth = len(work.get("authorships") or [])
-    return (has_doi, has_venue, has_date, cited_by, n_auth)
+    return (has_venue, has_doi, has_date, cited_by, n_auth)
 
 
-def work_dedupe_key(work: Dict[str, Any]) -> str:
+def work_dedupe_key(work: Work) -> str:
     """
     Key for “same paper” across multiple OpenAlex work IDs.
     1) DOI if available
     2) Else: normalized title + year + first author
     """
+    if isinstance(work, PublicationRecord):
+        return work.dedupe_key
     doi = normalized_doi(work)
     if doi:
         return f"doi:{doi}"
@@ -476,9 +1138,9 @@ def work_dedupe_key(work: Dict[str, Any]) -> str:
     return f"t:{title_norm}|y:{year}|a0:{first_author_norm}"
 
 
-def dedupe_works(works: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def dedupe_works(works: List[Work]) -> List[Work]:
     """Dedupe near-identical works; keep best by work_quality_key."""
-    best: Dict[str, Dict[str, Any]] = {}
+    best: Dict[str, Work] = {}
     for w in works:
         k = work_dedupe_key(w)
         prev = best.get(k)
@@ -487,47 +1149,664 @@ def dedupe_works(works: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return list(best.values())
 
 
+def _authorship_triple(a: Dict[str, Any]) -> Tuple[str, str, str]:
+    """(short author id, stripped display name, norm_name(display name)) of one authorship."""
+    author = a.get("author") or {}
+    disp = (author.get("display_name") or "").strip()
+    return canonical_openalex_id(author.get("id") or ""), disp, norm_name(disp)
+
+
+@dataclass(frozen=True)
+class PublicationRecord:
+    """
+    Immutable, slotted view of one OpenAlex work with everything the pipeline
+    derives from it computed once: DOI, link, venue, dates, dedupe/quality/sort
+    keys and the author id/name tuples. All helpers above accept it in place of
+    the raw work dict.
+    """
+
+    __slots__ = (
+        "work_id", "title", "title_key", "doi", "link", "venue", "date_full", "publication_year",
+        "cited_by_count", "author_ids", "author_names", "author_name_norms",
+        "dedupe_key", "quality_key", "sort_key",
+    )
+
+    work_id: str
+    title: str
+    title_key: str
+    doi: str
+    link: str
+    venue: str
+    date_full: str
+    publication_year: int
+    cited_by_count: int
+    author_ids: Tuple[str, ...]
+    author_names: Tuple[str, ...]
+    author_name_norms: Tuple[str, ...]
+    dedupe_key: str
+    quality_key: tuple
+    sort_key: Tuple[int, str]
+
+    @classmethod
+    def from_work(cls, work: Dict[str, Any]) -> "PublicationRecord":
+        triples = [_authorship_triple(a) for a in (work.get("authorships") or [])]
+        title = str(work.get("display_name") or "")
+        return cls(
+            work_id=canonical_openalex_id(work.get("id") or ""),
+            title=title,
+            title_key=title_key_lower(title),
+            doi=normalized_doi(work),
+            link=pick_best_link(work),
+            venue=pick_venue(work),
+            date_full=publication_date_yyyy_mm_dd(work),
+            publication_year=int(work.get("publication_year") or 0),
+            cited_by_count=int(work.get("cited_by_count") or 0),
+            author_ids=tuple(t[0] for t in triples),
+            author_names=tuple(t[1] for t in triples),
+            author_name_norms=tuple(t[2] for t in triples),
+            dedupe_key=work_dedupe_key(work),
+            quality_key=work_quality_key(work),
+            sort_key=work_sort_key(work),
+        )
+
+
+Work = Union[Dict[str, Any], PublicationRecord]
+
+
+# ----------------------------
+# Fuzzy near-duplicate detection (MinHash + LSH over title tokens)
+# ----------------------------
+
+_LATEX_CMD_RE = re.compile(r"\\[A-Za-z]+")
+_LATEX_MARKUP_RE = re.compile(r"[$^_{}]")
+_TITLE_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_MINHASH_PRIME = (1 << 61) - 1
+# a title that differs only by one of these is a companion output, not another version of the paper
+_COMPANION_TOKENS = frozenset({
+    "data", "dataset", "datasets", "code", "software", "supplementary", "supplement",
+    "erratum", "corrigendum", "correction", "reply", "comment", "response", "poster", "slides",
+})
+
+
+def fuzzy_title_tokens(title: str) -> frozenset:
+    """
+    Token set of a title for near-duplicate matching: LaTeX markup dropped
+    ("Multi$^{\\mathbf{3}}$Net" -> "multi3net"), accents folded, lowercased.
+    """
+    s = _LATEX_MARKUP_RE.sub("", _LATEX_CMD_RE.sub("", title or ""))
+    s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii").lower()
+    return frozenset(_TITLE_TOKEN_RE.findall(s))
+
+
+def _token_hash(token: str) -> int:
+    """Stable 64-bit token hash (str hash() is salted per process)."""
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _work_author_keys(w: Work) -> set[str]:
+    """Author IDs of a work, or normalized author names when OpenAlex has no IDs."""
+    ids = work_author_ids(w)
+    if ids:
+        return ids
+    if isinstance(w, PublicationRecord):
+        return set(filter(None, w.author_name_norms))
+    return {t[2] for t in (_authorship_triple(a) for a in (w.get("authorships") or [])) if t[2]}
+
+
+class NearDuplicateIndex:
+    """
+    MinHash signatures over title token sets, banded into LSH buckets so only
+    works that share a bucket are ever compared. Candidates are confirmed by
+    exact title Jaccard and author overlap; matches are merged with union-find.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        min_author_overlap: float = 0.5,
+        num_perm: int = 32,
+        bands: int = 8,
+        seed: int = 1,
+    ) -> None:
+        self.threshold = threshold
+        self.min_author_overlap = min_author_overlap
+        self.rows = num_perm // bands
+        rnd = random.Random(seed)
+        self._perms = [(rnd.randrange(1, _MINHASH_PRIME), rnd.randrange(_MINHASH_PRIME)) for _ in range(num_perm)]
+        self._token_sigs: Dict[str, Tuple[int, ...]] = {}
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        self._tokens: List[frozenset] = []
+        self._authors: List[set[str]] = []
+        self._published: List[bool] = []
+        self._parent: List[int] = []
+        self.comparisons = 0
+
+    def _token_sig(self, token: str) -> Tuple[int, ...]:
+        sig = self._token_sigs.get(token)
+        if sig is None:
+            h = _token_hash(token)
+            sig = self._token_sigs[token] = tuple((a * h + b) % _MINHASH_PRIME for a, b in self._perms)
+        return sig
+
+    def _signature(self, tokens: frozenset) -> Tuple[int, ...]:
+        # title words repeat across a corpus, so per-token permutations are computed once
+        return tuple(map(min, zip(*(self._token_sig(t) for t in tokens))))
+
+    def _find(self, i: int) -> int:
+        while self._parent[i] != i:
+            self._parent[i] = self._parent[self._parent[i]]
+            i = self._parent[i]
+        return i
+
+    def _matches(self, i: int, j: int) -> bool:
+        # two published records are two papers; only a preprint/unpublished copy is merged into one
+        if self._published[i] and self._published[j]:
+            return False
+        ti, tj = self._tokens[i], self._tokens[j]
+        # numbered parts/series ("Part 1" vs "Part 2") are different papers
+        diff = ti ^ tj
+        if any(t.isdigit() for t in diff) or not diff.isdisjoint(_COMPANION_TOKENS):
+            return False
+        if len(ti & tj) < self.threshold * len(ti | tj):
+            return False
+        ai, aj = self._authors[i], self._authors[j]
+        if not ai or not aj:
+            return False
+        return len(ai & aj) >= self.min_author_overlap * min(len(ai), len(aj))
+
+    def add(self, title: str, authors: set[str], published: bool = False) -> int:
+        """Index one item and merge it with every confirmed near-duplicate seen so far; returns its position."""
+        i = len(self._tokens)
+        tokens = fuzzy_title_tokens(title)
+        self._tokens.append(tokens)
+        self._authors.append(authors)
+        self._published.append(published)
+        self._parent.append(i)
+        if not tokens:
+            return i
+
+        sig = self._signature(tokens)
+        checked = {i}
+        for band in range(0, len(sig), self.rows):
+            bucket = self._buckets.setdefault((band, sig[band:band + self.rows]), [])
+            for j in bucket:
+                if j in checked:
+                    continue
+                checked.add(j)
+                self.comparisons += 1
+                if self._find(i) != self._find(j) and self._matches(i, j):
+                    self._parent[self._find(j)] = self._find(i)
+            bucket.append(i)
+        return i
+
+    def clusters(self) -> Dict[int, List[int]]:
+        """Root position -> positions of all items in that cluster (insertion order)."""
+        out: Dict[int, List[int]] = {}
+        for i in range(len(self._parent)):
+            out.setdefault(self._find(i), []).append(i)
+        return out
+
+
+def fuzzy_dedupe_works(
+    works: List[Work],
+    threshold: float = 0.8,
+    min_author_overlap: float = 0.5,
+) -> Tuple[List[Work], Dict[str, str]]:
+    """
+    Merge near-duplicates (e.g. an arXiv preprint and its published version):
+    similar titles (token Jaccard >= threshold) with overlapping authors, at
+    most one side published (work_is_published()). Keeps the best of each
+    cluster by work_quality_key() plus every published record in it (a preprint
+    can link two published papers), in input order.
+    Returns (kept works, {dropped work id: kept work id}).
+    """
+    ndx = NearDuplicateIndex(threshold=threshold, min_author_overlap=min_author_overlap)
+    published = [work_is_published(w) for w in works]
+    for w, pub in zip(works, published):
+        title = w.title if isinstance(w, PublicationRecord) else str(w.get("display_name") or "")
+        ndx.add(title, _work_author_keys(w), published=pub)
+
+    keep: set[int] = set()
+    superseded: Dict[str, str] = {}
+    for members in ndx.clusters().values():
+        best = max(members, key=lambda i: work_quality_key(works[i]))
+        keep.add(best)
+        best_id = _work_id(works[best])
+        for i in members:
+            if published[i]:
+                keep.add(i)
+            elif i != best:
+                superseded[_work_id(works[i])] = best_id
+    return [w for i, w in enumerate(works) if i in keep], superseded
+
+
+def _work_id(w: Work) -> str:
+    return w.work_id if isinstance(w, PublicationRecord) else canonical_openalex_id(w.get("id") or "")
+
+
+# ----------------------------
+# Run statistics
+# ----------------------------
+
+class SyncStats:
+    """
+    Instrumentation for one sync: wall time per pipeline stage (re-entering a stage
+    accumulates), HTTP requests / bytes / retries / sleep per endpoint, and files
+    parsed / written. Safe to update from fetch worker threads.
+    """
+
+    HTTP_FIELDS = ("requests", "cache_hits", "bytes", "retries", "slept_s", "request_s")
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, float] = {}
+        self.http: Dict[str, Dict[str, float]] = {}
+        self.files_parsed = 0
+        self.files_written = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            with self._lock:
+                self.stages[name] = self.stages.get(name, 0.0) + elapsed
+
+    def count_http(self, path: str, **deltas: float) -> None:
+        with self._lock:
+            ep = self.http.setdefault(path, dict.fromkeys(self.HTTP_FIELDS, 0))
+            for k, v in deltas.items():
+                ep[k] += v
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "stages_s": {k: round(v, 6) for k, v in self.stages.items()},
+            "http": {p: {k: round(v, 6) for k, v in ep.items()} for p, ep in self.http.items()},
+            "files_parsed": self.files_parsed,
+            "files_written": self.files_written,
+        }
+
+    def report(self) -> str:
+        lines = ["[PROFILE] Stage wall time (s; 'a.b' is part of 'a'):"]
+        for name, secs in self.stages.items():
+            lines.append(f"  {name:<24} {secs:10.3f}")
+        lines.append("[PROFILE] HTTP per endpoint:")
+        for path, ep in sorted(self.http.items()):
+            lines.append(
+                f"  {path:<10} requests={int(ep['requests'])} cache_hits={int(ep['cache_hits'])} "
+                f"bytes={int(ep['bytes']):,} retries={int(ep['retries'])} "
+                f"slept={ep['slept_s']:.2f}s in_request={ep['request_s']:.2f}s"
+            )
+        lines.append(f"[PROFILE] Files: parsed={self.files_parsed} written={self.files_written}")
+        return "\n".join(lines)
+
+
+# ----------------------------
+# HTTP response cache
+# ----------------------------
+
+class ResponseCache:
+    """
+    On-disk cache of OpenAlex JSON responses: one JSON file per request, keyed on
+    path + sorted params (mailto excluded). Entries younger than ttl_s are served
+    as-is; older ones are revalidated with ETag / Last-Modified when available.
+    """
+
+    UNKEYED_PARAMS = {"mailto", "api_key"}
+
+    def __init__(self, cache_dir: Path, ttl_s: float = 0.0, offline: bool = False):
+        self.cache_dir = cache_dir
+        self.ttl_s = ttl_s
+        self.offline = offline
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def key(self, path: str, params: Dict[str, Any]) -> str:
+        items = sorted((k, str(v)) for k, v in params.items() if k not in self.UNKEYED_PARAMS)
+        raw = json.dumps([path, items], ensure_ascii=False)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        p = self._path(key)
+        try:
+            return json.loads(p.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key: str, entry: Dict[str, Any]) -> None:
+        p = self._path(key)
+        # concurrent fetch threads may store the same key
+        _replace_text(p, json.dumps(entry, ensure_ascii=False), tmp_tag=f".{os.getpid()}.{threading.get_ident()}")
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return (time.time() - float(entry.get("fetched_at") or 0)) < self.ttl_s
+
+    def count(self, attr: str) -> None:
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + 1)
+
+
+# ----------------------------
+# Rate limiting
+# ----------------------------
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """
+    Token bucket shared by all fetch threads. Starts at `rate` requests/s, ramps up
+    a little after every success (up to max_rate), halves on 429/5xx, and honors
+    Retry-After by pausing every caller until the server's deadline.
+    rate <= 0 disables limiting.
+    """
+
+    def __init__(self, rate: float, max_rate: float = 10.0, min_rate: float = 0.5, ramp: float = 0.05):
+        self.max_rate = max(max_rate, rate)
+        self.min_rate = min(min_rate, rate) if rate > 0 else min_rate
+        self.rate = rate
+        self.ramp = ramp
+        self._tokens = 1.0
+        self._last = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a request may start; returns seconds slept."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(1.0, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1.0  # reserve; a negative balance queues later callers behind us
+            wait = max(-self._tokens / self.rate, self._paused_until - now, 0.0)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def on_success(self) -> None:
+        if self.rate > 0:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate * (1.0 + self.ramp))
+
+    def on_throttled(self, pause_s: float = 0.0) -> None:
+        if self.rate > 0:
+            with self._lock:
+                self.rate = max(self.min_rate, self.rate / 2.0)
+                self._paused_until = max(self._paused_until, time.monotonic() + pause_s)
+
+
+def retry_after_seconds(resp: Any) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date); None if absent/invalid."""
+    value = ((getattr(resp, "headers", None) or {}).get("Retry-After") or "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_seconds(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """Jittered exponential backoff for retry number `attempt` (0-based)."""
+    return min(cap, base * (2 ** attempt)) * random.uniform(0.5, 1.5)
+
+
 # ----------------------------
 # OpenAlex client
 # ----------------------------
 
 class OpenAlexClient:
-    def __init__(self, mailto: str, sleep_s: float = 0.12, timeout: float = 30.0):
+    """
+    Thin OpenAlex REST client. Safe to share between worker threads:
+    each thread gets its own requests.Session, and all threads draw from one
+    RateLimiter that starts at one request per sleep_s and adapts up to max_rps.
+    429/5xx/connection errors are retried with backoff (max_retries times).
+    """
+
+    def __init__(
+        self,
+        mailto: str,
+        sleep_s: float = 0.12,
+        timeout: float = 30.0,
+        work_select: Optional[List[str]] = WORK_SELECT_FIELDS,
+        measure_select_savings: bool = False,
+        cache: Optional[ResponseCache] = None,
+        api_key: Optional[str] = None,
+        session_factory: Optional[Callable[[], Any]] = None,
+        stats: Optional[SyncStats] = None,
+        max_rps: float = 10.0,
+        max_retries: int = 5,
+    ):
         self.mailto = mailto
+        self.api_key = api_key
+        self.session_factory = session_factory or requests.Session
+        self.stats = stats or SyncStats()
+        self.cache = cache
         self.sleep_s = sleep_s
         self.timeout = timeout
-        self.sess = requests.Session()
+        self.max_retries = max_retries
+        self.limiter = RateLimiter(rate=(1.0 / sleep_s) if sleep_s > 0 else 0.0, max_rate=max_rps)
+        self.work_select = list(work_select) if work_select else None
+        self.measure_select_savings = measure_select_savings
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.bytes_received = 0
+        # select= savings sampling (measure_select_savings): bytes of the same pages with/without select
+        self.sampled_select_bytes = 0
+        self.sampled_full_bytes = 0
+        self.works_select_bytes = 0
+
+    @property
+    def sess(self) -> requests.Session:
+        sess = getattr(self._local, "sess", None)
+        if sess is None:
+            sess = self._local.sess = self.session_factory()
+        return sess
+
+    def _send(self, path: str, url: str, params: Dict[str, Any], headers: Dict[str, str]) -> Any:
+        """One GET through the rate limiter, retrying 429/5xx/connection errors with backoff."""
+        for attempt in range(self.max_retries + 1):
+            slept = self.limiter.acquire()
+            t0 = time.perf_counter()
+            try:
+                r = self.sess.get(url, params=params, timeout=self.timeout, headers=headers or None)
+            except (requests.ConnectionError, requests.Timeout):
+                self.stats.count_http(path, slept_s=slept, request_s=time.perf_counter() - t0)
+                if attempt == self.max_retries:
+                    raise
+                pause = backoff_seconds(attempt)
+                self.limiter.on_throttled()
+            else:
+                nbytes = len(r.content)
+                self.stats.count_http(path, requests=1, bytes=nbytes, slept_s=slept, request_s=time.perf_counter() - t0)
+                with self._stats_lock:
+                    self.bytes_received += nbytes
+                if r.status_code not in RETRY_STATUS or attempt == self.max_retries:
+                    if r.status_code < 400:
+                        self.limiter.on_success()
+                    return r
+                retry_after = retry_after_seconds(r)
+                pause = retry_after if retry_after is not None else backoff_seconds(attempt)
+                self.limiter.on_throttled(pause if retry_after is not None else 0.0)
+            self.stats.count_http(path, retries=1, slept_s=pause)
+            time.sleep(pause)
+        raise AssertionError("unreachable")
+
+    def _request(self, path: str, params: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+        """GET path; returns (json, bytes received over the network; 0 when served from cache)."""
+        cache = self.cache
+        key = cache.key(path, params) if cache else ""
+        entry = cache.load(key) if cache else None
+        if cache and entry is not None and (cache.offline or cache.is_fresh(entry)):
+            cache.count("hits")
+            self.stats.count_http(path, cache_hits=1)
+            return entry["body"], 0
+        if cache and cache.offline:
+            raise SystemExit(f"[offline] No cached response for {path} {params}")
+
+        headers: Dict[str, str] = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
 
-    def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
         params = dict(params)
         params["mailto"] = self.mailto
+        if self.api_key:
+            params["api_key"] = self.api_key
         url = f"{OPENALEX_API}{path}"
-        r = self.sess.get(url, params=params, timeout=self.timeout)
+        r = self._send(path, url, params, headers)
+        nbytes = len(r.content)
+
+        if cache and entry is not None and r.status_code == 304:
+            cache.count("revalidated")
+            entry["fetched_at"] = time.time()
+            cache.store(key, entry)
+            return entry["body"], nbytes
+
         r.raise_for_status()
-        time.sleep(self.sleep_s)
-        return r.json()
+        body = r.json()
+        if cache:
+            cache.count("misses")
+            cache.store(key, {
+                "fetched_at": time.time(),
+                "etag": r.headers.get("ETag"),
+                "last_modified": r.headers.get("Last-Modified"),
+                "body": body,
+            })
+        return body, nbytes
+
+    def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._request(path, params)[0]
+
+    def select_savings_estimate(self) -> Optional[int]:
+        """Estimated bytes saved by select= this run (None unless savings were sampled)."""
+        if not self.sampled_select_bytes:
+            return None
+        ratio = self.sampled_full_bytes / self.sampled_select_bytes
+        return int(self.works_select_bytes * (ratio - 1.0))
 
     def search_author_candidates(self, name: str, per_page: int = 5) -> List[Dict[str, Any]]:
         data = self._get("/authors", {"search": name, "per-page": per_page})
         return data.get("results", []) or []
 
-    def iter_works_by_author(self, author_id: str, per_page: int = 200) -> Iterable[Dict[str, Any]]:
-        cursor = "*"
-        short_id = canonical_openalex_id(author_id)
-
+    def iter_works(
+        self,
+        filter_expr: str,
+        per_page: int = 200,
+        sort: Optional[str] = None,
+    ) -> Iterable[Dict[str, Any]]:
+        """Page through /works for an OpenAlex filter expression using cursor pagination."""
+        for results, _next_cursor in self.iter_work_pages(filter_expr, per_page=per_page, sort=sort):
+            yield from results
+
+    def iter_work_pages(
+        self,
+        filter_expr: str,
+        per_page: int = 200,
+        sort: Optional[str] = None,
+        cursor: str = "*",
+        select: Optional[List[str]] = None,
+    ) -> Iterator[Tuple[List[Dict[str, Any]], Optional[str]]]:
+        """
+        Cursor pagination starting at `cursor` (e.g. a checkpointed next_cursor).
+        Yields (results, next_cursor) per page; next_cursor is None on the last page.
+        `select` overrides the client's work_select for this chain.
+        """
         while True:
-            data = self._get(
-                "/works",
-                {"filter": f"authorships.author.id:{short_id}", "per-page": per_page, "cursor": cursor},
-            )
-            for w in data.get("results", []) or []:
-                yield w
-
+            params: Dict[str, Any] = {"filter": filter_expr, "per-page": per_page, "cursor": cursor}
+            if sort:
+                params["sort"] = sort
+            if select:
+                params["select"] = ",".join(select)
+            elif self.work_select:
+                params["select"] = ",".join(self.work_select)
+            data, nbytes = self._request("/works", params)
+            if self.work_select and not select:
+                with self._stats_lock:
+                    self.works_select_bytes += nbytes
+                if self.measure_select_savings and cursor == "*":
+                    # Debug only: fetch the chain's first page again without select= to size the savings.
+                    full_params = {k: v for k, v in params.items() if k != "select"}
+                    _full, full_bytes = self._request("/works", full_params)
+                    with self._stats_lock:
+                        self.sampled_select_bytes += nbytes
+                        self.sampled_full_bytes += full_bytes
             meta = data.get("meta") or {}
             cursor = meta.get("next_cursor")
+            yield data.get("results", []) or [], cursor or None
             if not cursor:
                 break
 
+    def iter_works_by_ids(self, work_ids: List[str], select: Optional[List[str]] = None) -> Iterable[Dict[str, Any]]:
+        """Look up up to OPENALEX_MAX_OR_VALUES works by ID in one request (pipe-joined openalex_id filter)."""
+        expr = "openalex_id:" + self._or_values(work_ids)
+        for results, _next_cursor in self.iter_work_pages(expr, per_page=OPENALEX_MAX_OR_VALUES, select=select):
+            yield from results
+
+    @staticmethod
+    def _or_values(ids: List[str]) -> str:
+        """Short IDs pipe-joined for one OR filter (at most OPENALEX_MAX_OR_VALUES)."""
+        if len(ids) > OPENALEX_MAX_OR_VALUES:
+            raise ValueError(f"At most {OPENALEX_MAX_OR_VALUES} ids per OR filter, got {len(ids)}")
+        return "|".join(canonical_openalex_id(i) for i in ids)
+
+    @staticmethod
+    def _authors_filter(
+        author_ids: List[str],
+        coauthor_id: Optional[str] = None,
+        since: Optional[str] = None,
+    ) -> str:
+        """
+        authorships.author.id OR-filter, optionally ANDed with a required co-author
+        and restricted to works created/updated on or after `since` (YYYY-MM-DD).
+        """
+        short_ids = OpenAlexClient._or_values(author_ids)
+        expr = f"authorships.author.id:{short_ids}"
+        if coauthor_id:
+            co = canonical_openalex_id(coauthor_id)
+            if short_ids.upper() != co.upper():
+                expr += f",authorships.author.id:{co}"
+        if since:
+            expr += f",from_updated_date:{since}"
+        return expr
+
+    def iter_works_by_author(
+        self,
+        author_id: str,
+        per_page: int = 200,
+        coauthor_id: Optional[str] = None,
+        since: Optional[str] = None,
+    ) -> Iterable[Dict[str, Any]]:
+        """Works by author_id (and, if given, also co-authored by coauthor_id)."""
+        return self.iter_works(self._authors_filter([author_id], coauthor_id, since), per_page=per_page)
+
+    def author_work_pages(
+        self,
+        author_ids: List[str],
+        per_page: int = 200,
+        sort: Optional[str] = None,
+        coauthor_id: Optional[str] = None,
+        since: Optional[str] = None,
+        cursor: str = "*",
+    ) -> Iterator[Tuple[List[Dict[str, Any]], Optional[str]]]:
+        """Pages of works by ANY of author_ids (one OR-filter cursor chain), resumable from `cursor`."""
+        expr = self._authors_filter(author_ids, coauthor_id, since)
+        return self.iter_work_pages(expr, per_page=per_page, sort=sort, cursor=cursor)
+
 
 # ----------------------------
 # Data model / members
@@ -540,10 +1819,10 @@ class Member:
     openalex_author_id: Optional[str] = None
 
 
-def load_members(members_dir: Path) -> List[Member]:
+def load_members(members_dir: Path, cache: Optional[FrontMatterCache] = None) -> List[Member]:
     members: List[Member] = []
-    for p in sorted(members_dir.glob("*.md")):
-        fm, _body = read_front_matter(p)
+    for e in (cache or FrontMatterCache()).load_dir(members_dir).values():
+        fm = e["fm"]
         name = (fm.get("name") or "").strip()
         if not name:
             continue
@@ -552,36 +1831,718 @@ def load_members(members_dir: Path) -> List[Member]:
     return members
 
 
-def choose_author_id(
-    client: OpenAlexClient,
+AUTHOR_CANDIDATES_PER_MEMBER = 10
+AUTHOR_CONFIDENT_NAME_SIMILARITY = 0.8
+
+
+def _candidate_institutions(c: Dict[str, Any]) -> List[str]:
+    """Institution names of an /authors result (legacy last_known_institution and the newer list)."""
+    insts = [c.get("last_known_institution") or {}] + list(c.get("last_known_institutions") or [])
+    return [str(i["display_name"]) for i in insts if isinstance(i, dict) and i.get("display_name")]
+
+
+def score_author_candidate(
     member: Member,
+    c: Dict[str, Any],
     institution_hint: Optional[str],
-    cache: Dict[str, Any],
-) -> Optional[str]:
-    k = member.name_norm
-    if k in cache:
-        return cache[k].get("openalex_author_id")
+    pi_coauthor_ids: frozenset,
+) -> Dict[str, Any]:
+    """Score one /authors candidate: name similarity, institution hint, co-authorship with the PI."""
+    names = [c.get("display_name") or ""] + list(c.get("display_name_alternatives") or [])
+    name_sim = max(difflib.SequenceMatcher(None, member.name_norm, norm_name(n)).ratio() for n in names)
+    insts = _candidate_institutions(c)
+    inst_hit = bool(institution_hint) and any(institution_hint.lower() in i.lower() for i in insts)
+    coauthor = canonical_openalex_id(c.get("id") or "").upper() in pi_coauthor_ids
+    return {
+        "id": c.get("id"),
+        "display_name": c.get("display_name"),
+        "institution": insts[0] if insts else None,
+        "works_count": int(c.get("works_count") or 0),
+        "name_similarity": round(name_sim, 3),
+        "institution_match": inst_hit,
+        "coauthor_of_pi": coauthor,
+        "score": round(0.5 * name_sim + 0.2 * inst_hit + 0.3 * coauthor, 3),
+    }
+
+
+def author_confidence(best: Dict[str, Any], runner_up: Optional[Dict[str, Any]]) -> str:
+    """high: a PI co-author with a matching name; medium: matching name and unambiguous; else low."""
+    if best["name_similarity"] < AUTHOR_CONFIDENT_NAME_SIMILARITY:
+        return "low"
+    if best["coauthor_of_pi"]:
+        return "high"
+    if best["institution_match"] or runner_up is None or best["score"] - runner_up["score"] >= 0.2:
+        return "medium"
+    return "low"
+
 
-    cands = client.search_author_candidates(member.name, per_page=5)
+def author_cache_entry(
+    member: Member,
+    cands: List[Dict[str, Any]],
+    institution_hint: Optional[str],
+    pi_coauthor_ids: frozenset,
+    resolved_at: datetime,
+) -> Dict[str, Any]:
+    """Author cache entry for one member: the pick plus the scored candidate list and a timestamp."""
+    stamp = resolved_at.isoformat(timespec="seconds")
     if not cands:
-        cache[k] = {"openalex_author_id": None, "note": "no candidates"}
-        return None
+        return {"openalex_author_id": None, "note": "no candidates", "resolved_at": stamp, "candidates": []}
 
-    def score(c: Dict[str, Any]) -> Tuple[int, int]:
-        inst = ((c.get("last_known_institution") or {}).get("display_name") or "")
-        inst_hit = 1 if institution_hint and institution_hint.lower() in inst.lower() else 0
-        works_count = int(c.get("works_count") or 0)
-        return (inst_hit, works_count)
-
-    best = max(cands, key=score)
-    best_id = best.get("id")
-    cache[k] = {
-        "openalex_author_id": best_id,
-        "picked_display_name": best.get("display_name"),
-        "picked_institution": ((best.get("last_known_institution") or {}).get("display_name")),
-        "picked_works_count": best.get("works_count"),
+    scored = sorted(
+        (score_author_candidate(member, c, institution_hint, pi_coauthor_ids) for c in cands),
+        key=lambda s: (s["score"], s["works_count"]),
+        reverse=True,
+    )
+    best = scored[0]
+    return {
+        "openalex_author_id": best["id"],
+        "picked_display_name": best["display_name"],
+        "picked_institution": best["institution"],
+        "picked_works_count": best["works_count"],
+        "confidence": author_confidence(best, scored[1] if len(scored) > 1 else None),
+        "resolved_at": stamp,
+        "candidates": scored,
     }
-    return best_id
+
+
+def author_cache_entry_expired(entry: Dict[str, Any], negative_ttl_days: float, now: datetime) -> bool:
+    """Picks are kept; "no candidates" entries expire after negative_ttl_days (untimestamped ones already have)."""
+    if entry.get("openalex_author_id"):
+        return False
+    stamp = entry.get("resolved_at")
+    if not stamp:
+        return True
+    return now - datetime.fromisoformat(stamp) >= timedelta(days=negative_ttl_days)
+
+
+def pi_coauthor_ids(client: OpenAlexClient, pi_author_id: str) -> frozenset:
+    """Upper-cased author IDs appearing on the PI's works."""
+    ids: set[str] = set()
+    for w in client.iter_works_by_author(pi_author_id):
+        ids |= work_author_ids(w)
+    return frozenset(ids)
+
+
+def resolve_members(
+    client: OpenAlexClient,
+    members: List[Member],
+    institution_hint: Optional[str],
+    cache: Dict[str, Any],
+    pi_coauthors: frozenset = frozenset(),
+    concurrency: int = 1,
+    negative_ttl_days: float = 14.0,
+    lookup: bool = True,
+) -> Tuple[List[Member], List[Dict[str, Any]]]:
+    """
+    Resolve OpenAlex author IDs for all members. Pinned IDs win; cache misses and
+    expired negative entries are looked up concurrently and scored (lookup=False
+    uses pinned and cached IDs only). Returns (members with IDs, confidence report rows).
+    """
+    now = datetime.now(timezone.utc)
+    todo: Dict[str, Member] = {}
+    for m in members:
+        entry = cache.get(m.name_norm)
+        if not m.openalex_author_id and (entry is None or author_cache_entry_expired(entry, negative_ttl_days, now)):
+            todo.setdefault(m.name_norm, m)
+    if not lookup:
+        todo = {}
+
+    def search(m: Member) -> Tuple[Member, List[Dict[str, Any]]]:
+        return m, client.search_author_candidates(m.name, per_page=AUTHOR_CANDIDATES_PER_MEMBER)
+
+    if todo:
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(todo)))) as pool:
+            for m, cands in pool.map(search, todo.values()):
+                cache[m.name_norm] = author_cache_entry(m, cands, institution_hint, pi_coauthors, now)
+
+    resolved: List[Member] = []
+    report: List[Dict[str, Any]] = []
+    for m in members:
+        if m.openalex_author_id:
+            aid = canonical_openalex_id(m.openalex_author_id)
+            resolved.append(Member(m.name, m.name_norm, aid))
+            report.append({"name": m.name, "openalex_author_id": aid, "source": "pinned", "confidence": "pinned", "needs_pin": False})
+            continue
+
+        entry = cache.get(m.name_norm) or {}
+        aid = canonical_openalex_id(entry["openalex_author_id"]) if entry.get("openalex_author_id") else None
+        resolved.append(Member(m.name, m.name_norm, aid))
+        confidence = entry.get("confidence") or ("unscored" if aid else "none")
+        report.append({
+            "name": m.name,
+            "openalex_author_id": aid,
+            "source": "resolved" if m.name_norm in todo else "cache",
+            "confidence": confidence,
+            "needs_pin": confidence in ("low", "none"),
+            "candidates": (entry.get("candidates") or [])[:3],
+        })
+    return resolved, report
+
+
+def write_author_report(path: Path, report: List[Dict[str, Any]]) -> None:
+    """JSON confidence report; members with needs_pin should get an openalex_author_id in _members."""
+    data = {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "needs_pin": [r["name"] for r in report if r["needs_pin"]],
+        "members": report,
+    }
+    _replace_text(path, json.dumps(data, indent=2, ensure_ascii=False) + "\n")
+
+
+class SyncState:
+    """
+    Incremental sync state (JSON next to the author cache): per-author watermarks
+    plus the works seen so far, so later runs only fetch what changed.
+
+    {"authors": {"A1": {"last_sync": iso, "last_full_sync": iso, "work_ids": [...]}},
+     "works":   {"W1": {...work...}}}
+    """
+
+    def __init__(self, path: Path, overlap_days: float = 1.0, full_resync_days: float = 30.0):
+        self.path = path
+        self.overlap_days = overlap_days
+        self.full_resync_days = full_resync_days
+        self.authors: Dict[str, Dict[str, Any]] = {}
+        self.works: Dict[str, Dict[str, Any]] = {}
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            self.authors = data.get("authors") or {}
+            self.works = data.get("works") or {}
+
+    @staticmethod
+    def _key(author_id: str) -> str:
+        return canonical_openalex_id(author_id).upper()
+
+    def since(self, author_id: str) -> Optional[str]:
+        """from_updated_date for this author, or None when a full fetch is due."""
+        a = self.authors.get(self._key(author_id))
+        if not a or not a.get("last_sync") or not a.get("last_full_sync"):
+            return None
+        now = datetime.now(timezone.utc)
+        last_full = datetime.fromisoformat(a["last_full_sync"])
+        if self.full_resync_days and now - last_full >= timedelta(days=self.full_resync_days):
+            return None
+        since = datetime.fromisoformat(a["last_sync"]) - timedelta(days=self.overlap_days)
+        return since.date().isoformat()
+
+    def record(self, author_id: str, works: List[Dict[str, Any]], full: bool, synced_at: datetime) -> None:
+        """Merge one author's fetch result; a full fetch replaces that author's work list."""
+        a = self.authors.setdefault(self._key(author_id), {})
+        wids = [canonical_openalex_id(w.get("id") or "") for w in works]
+        for wid, w in zip(wids, works):
+            self.works[wid] = w
+        if full:
+            a["work_ids"] = wids
+            a["last_full_sync"] = synced_at.isoformat()
+        else:
+            known = a.setdefault("work_ids", [])
+            seen = set(known)
+            for wid in wids:
+                if wid not in seen:
+                    known.append(wid)
+                    seen.add(wid)
+        a["last_sync"] = synced_at.isoformat()
+
+    def works_for(self, author_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Stored works of the given authors, merged in author order (like a full fetch)."""
+        out: Dict[str, Dict[str, Any]] = {}
+        for aid in author_ids:
+            for wid in (self.authors.get(self._key(aid)) or {}).get("work_ids") or []:
+                if wid in self.works:
+                    out[wid] = self.works[wid]
+        return out
+
+    def save(self) -> None:
+        referenced = {wid for a in self.authors.values() for wid in a.get("work_ids") or []}
+        self.works = {wid: w for wid, w in self.works.items() if wid in referenced}
+        _replace_text(self.path, json.dumps({"authors": self.authors, "works": self.works}))
+
+
+@dataclass
+class JobProgress:
+    """Fetch progress of one cursor chain (one member, or one OR-filter batch) restored from a checkpoint."""
+
+    key: str
+    cursor: str = "*"
+    done: bool = False
+    works: List[Dict[str, Any]] = field(default_factory=list)
+    seen: int = 0
+    budget: Dict[str, int] = field(default_factory=dict)
+
+
+class FetchCheckpoint:
+    """
+    Append-only JSON Lines log of fetch progress, so an interrupted sync can
+    continue with --resume instead of restarting every cursor chain at "*".
+
+    The first line is a header with the run signature (options that change what
+    a chain returns); each fetched page appends its chain's next_cursor, the
+    works kept from that page and the limit counters; a finished chain appends
+    "done". Appending keeps the cost linear in the pages fetched.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path, signature: Dict[str, Any], resume: bool = False):
+        self.path = path
+        self.signature = signature
+        self.jobs: Dict[str, JobProgress] = self._replay() if resume else {}
+        self._lock = threading.Lock()
+
+        # start a compacted log: header plus one line per restored chain
+        lines = [json.dumps({"version": self.VERSION, "signature": signature})]
+        lines += [
+            json.dumps({
+                "job": job.key, "cursor": job.cursor, "works": job.works,
+                "seen": job.seen, "budget": job.budget, "done": job.done,
+            })
+            for job in self.jobs.values()
+        ]
+        _replace_text(path, "".join(line + "\n" for line in lines))
+        self._fh = path.open("a", encoding="utf-8")
+
+    def _replay(self) -> Dict[str, JobProgress]:
+        if not self.path.exists():
+            return {}
+        jobs: Dict[str, JobProgress] = {}
+        with self.path.open(encoding="utf-8") as fh:
+            for n, line in enumerate(fh):
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    break  # torn last line of an interrupted run
+                if n == 0:
+                    if rec.get("version") != self.VERSION or rec.get("signature") != self.signature:
+                        print("[WARN] Checkpoint was written with different sync options; starting over.")
+                        return {}
+                    continue
+                job = jobs.setdefault(rec["job"], JobProgress(rec["job"]))
+                job.works.extend(rec.get("works") or [])
+                job.cursor = rec.get("cursor") or job.cursor
+                job.seen = rec.get("seen", job.seen)
+                job.budget = rec.get("budget") or job.budget
+                job.done = job.done or bool(rec.get("done"))
+        return jobs
+
+    @staticmethod
+    def job_key(members: List[Member], since: Optional[str]) -> str:
+        ids = sorted(canonical_openalex_id(m.openalex_author_id).upper() for m in members)
+        return f"{'|'.join(ids)}@{since or ''}"
+
+    def job(self, members: List[Member], since: Optional[str]) -> JobProgress:
+        key = self.job_key(members, since)
+        return self.jobs.get(key) or JobProgress(key)
+
+    def page(
+        self,
+        job: JobProgress,
+        works: List[Dict[str, Any]],
+        next_cursor: Optional[str],
+        seen: int = 0,
+        budget: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """Record one fetched page; next_cursor None marks the chain finished."""
+        rec = {"job": job.key, "cursor": next_cursor, "works": works, "seen": seen, "budget": budget or {}}
+        if next_cursor is None:
+            rec["done"] = True
+        with self._lock:
+            self._fh.write(json.dumps(rec) + "\n")
+            self._fh.flush()
+
+    def close(self, remove: bool = False) -> None:
+        self._fh.close()
+        if remove:
+            self.path.unlink(missing_ok=True)
+
+
+WorkHook = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+def fetch_member_works(
+    client: OpenAlexClient,
+    member: Member,
+    limit: int = 0,
+    coauthor_id: Optional[str] = None,
+    since: Optional[str] = None,
+    on_work: Optional[WorkHook] = None,
+    checkpoint: Optional[FetchCheckpoint] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Drain one member's cursor chain (newest N only if limit > 0).
+    on_work maps each arriving work to what is kept (None drops it); the limit
+    still counts every work the member has. With a checkpoint every page is
+    recorded, and a chain restored from it continues at its saved cursor.
+    """
+    job = checkpoint.job([member], since) if checkpoint else JobProgress("")
+    if job.done:
+        print(f"[INFO] {member.name}: {len(job.works)} works restored from checkpoint")
+        return job.works
+
+    changed = f", updated since {since}" if since else ""
+    resumed = ", resuming" if job.cursor != "*" else ""
+    print(f"[INFO] Fetching works for {member.name} ({member.openalex_author_id}{changed}{resumed})")
+    works: List[Dict[str, Any]] = list(job.works)
+    seen = job.seen
+    pages = client.author_work_pages(
+        [member.openalex_author_id],
+        per_page=200,
+        sort=LIMIT_SORT if limit else None,
+        coauthor_id=coauthor_id,
+        since=since,
+        cursor=job.cursor,
+    )
+    for page, next_cursor in pages:
+        kept_page: List[Dict[str, Any]] = []
+        for w in page:
+            if not canonical_openalex_id(w.get("id") or ""):
+                continue
+            seen += 1
+            kept = on_work(w) if on_work else w
+            if kept is not None:
+                kept_page.append(kept)
+            if limit and seen >= limit:
+                next_cursor = None
+                break
+        works.extend(kept_page)
+        if checkpoint:
+            checkpoint.page(job, kept_page, next_cursor, seen=seen)
+        if next_cursor is None:
+            break
+    return works
+
+
+def fetch_batch_works(
+    client: OpenAlexClient,
+    batch: List[Member],
+    limit: int = 0,
+    coauthor_id: Optional[str] = None,
+    since: Optional[str] = None,
+    on_work: Optional[WorkHook] = None,
+    checkpoint: Optional[FetchCheckpoint] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Drain ONE cursor chain for a batch of members (OR filter), so shared papers are
+    downloaded once. With limit > 0 a work is kept only while one of its batch members
+    still has budget, matching the per-member "newest N works" meaning.
+    on_work and checkpoint are applied as in fetch_member_works().
+    """
+    names = ", ".join(m.name for m in batch)
+    job = checkpoint.job(batch, since) if checkpoint else JobProgress("")
+    if job.done:
+        print(f"[INFO] {len(batch)} members ({names}): {len(job.works)} works restored from checkpoint")
+        return job.works
+
+    changed = f", updated since {since}" if since else ""
+    resumed = ", resuming" if job.cursor != "*" else ""
+    print(f"[INFO] Fetching works for {len(batch)} members in one query ({names}{changed}{resumed})")
+
+    budget = {canonical_openalex_id(m.openalex_author_id).upper(): 0 for m in batch}
+    budget.update(job.budget)
+    works: List[Dict[str, Any]] = list(job.works)
+    pages = client.author_work_pages(
+        list(budget), per_page=200, sort=LIMIT_SORT if limit else None, coauthor_id=coauthor_id, since=since, cursor=job.cursor
+    )
+    for page, next_cursor in pages:
+        kept_page: List[Dict[str, Any]] = []
+        for w in page:
+            if not canonical_openalex_id(w.get("id") or ""):
+                continue
+            if limit:
+                hits = {aid for aid in work_author_ids(w) if aid in budget and budget[aid] < limit}
+                if not hits:
+                    continue
+                for aid in hits:
+                    budget[aid] += 1
+            kept = on_work(w) if on_work else w
+            if kept is not None:
+                kept_page.append(kept)
+            if limit and all(n >= limit for n in budget.values()):
+                next_cursor = None
+                break
+        works.extend(kept_page)
+        if checkpoint:
+            checkpoint.page(job, kept_page, next_cursor, budget=budget)
+        if next_cursor is None:
+            break
+    return works
+
+
+def collect_works(
+    client: OpenAlexClient,
+    members: List[Member],
+    limit_per_member: int = 0,
+    concurrency: int = 1,
+    batch_size: int = 0,
+    coauthor_id: Optional[str] = None,
+    state: Optional[SyncState] = None,
+    on_work: Optional[WorkHook] = None,
+    checkpoint: Optional[FetchCheckpoint] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch works for all members and dedupe by OpenAlex work id.
+    batch_size > 0 pages members in OR-filter batches of that size instead of one
+    cursor chain per member. coauthor_id restricts every query server-side to works
+    that author is also on. With concurrency > 1 the chains run in a thread pool;
+    results are still merged in order, so works_by_id matches the serial path.
+
+    With a SyncState, members synced recently only fetch works updated since their
+    watermark; the result is the stored corpus with those changes merged in.
+    on_work transforms/drops each work as it arrives (streaming mode).
+    A FetchCheckpoint records every page and restores chains of an interrupted run.
+    """
+    fetchable: List[Member] = []
+    seen_ids: set[str] = set()
+    for m in members:
+        if not m.openalex_author_id:
+            print(f"[WARN] No OpenAlex author ID for member: {m.name} (add openalex_author_id to fix)")
+            continue
+        if batch_size or state:
+            aid = canonical_openalex_id(m.openalex_author_id).upper()
+            if aid in seen_ids:
+                continue
+            seen_ids.add(aid)
+        fetchable.append(m)
+
+    started_at = datetime.now(timezone.utc)
+    since_by_member = {id(m): (state.since(m.openalex_author_id) if state else None) for m in fetchable}
+
+    # A job is (members, since); batches only group members that share a watermark.
+    jobs: List[Tuple[List[Member], Optional[str]]] = []
+    if batch_size:
+        batch_size = min(batch_size, OPENALEX_MAX_OR_VALUES)
+        groups: Dict[Optional[str], List[Member]] = {}
+        for m in fetchable:
+            groups.setdefault(since_by_member[id(m)], []).append(m)
+        for since, group in groups.items():
+            jobs.extend((group[i:i + batch_size], since) for i in range(0, len(group), batch_size))
+
+        def fetch(job: Tuple[List[Member], Optional[str]]) -> List[Dict[str, Any]]:
+            batch, since = job
+            return fetch_batch_works(
+                client, batch, limit=limit_per_member, coauthor_id=coauthor_id, since=since, on_work=on_work,
+                checkpoint=checkpoint,
+            )
+    else:
+        jobs = [([m], since_by_member[id(m)]) for m in fetchable]
+
+        def fetch(job: Tuple[List[Member], Optional[str]]) -> List[Dict[str, Any]]:
+            (m,), since = job
+            return fetch_member_works(
+                client, m, limit=limit_per_member, coauthor_id=coauthor_id, since=since, on_work=on_work,
+                checkpoint=checkpoint,
+            )
+
+    works_by_id: Dict[str, Dict[str, Any]] = {}
+
+    def merge(per_job: Iterable[List[Dict[str, Any]]]) -> None:
+        for job, works in zip(jobs, per_job):
+            for w in works:
+                works_by_id[canonical_openalex_id(w.get("id") or "")] = w
+            if state:
+                batch, since = job
+                for m in batch:
+                    aid = canonical_openalex_id(m.openalex_author_id).upper()
+                    own = works if len(batch) == 1 else [w for w in works if aid in work_author_ids(w)]
+                    state.record(m.openalex_author_id, own, full=since is None, synced_at=started_at)
+
+    if concurrency <= 1 or len(jobs) <= 1:
+        merge(fetch(j) for j in jobs)
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            merge(pool.map(fetch, jobs))
+
+    if state:
+        state.save()
+        return state.works_for([m.openalex_author_id for m in fetchable])
+    return works_by_id
+
+
+# ----------------------------
+# OpenAlex snapshot source (--snapshot-dir)
+# ----------------------------
+
+def snapshot_partitions(snapshot_dir: Path) -> List[Path]:
+    """
+    Gzipped JSON Lines works partitions of an OpenAlex snapshot, oldest first.
+    Accepts the snapshot root (data/works/updated_date=*/part_*.gz) or any directory of .gz partitions.
+    """
+    works_dir = snapshot_dir / "data" / "works"
+    root = works_dir if works_dir.is_dir() else snapshot_dir
+    return sorted(root.rglob("*.gz"))
+
+
+def _author_ids_pattern(author_ids: Iterable[str]) -> bytes:
+    """Bytes regex matching any of the short author IDs as a whole OpenAlex ID (A1 doesn't match A12)."""
+    alts = b"|".join(re.escape(canonical_openalex_id(a).upper().encode("ascii")) for a in sorted(set(author_ids)))
+    return b"(?:" + alts + b")(?![0-9])"
+
+
+def scan_snapshot_partition(
+    path: Path,
+    id_pattern: bytes,
+    author_ids: frozenset,
+    coauthor_id: Optional[str] = None,
+    select: Optional[List[str]] = None,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Stream one partition and return (works with one of author_ids among their authorships, bytes read).
+    Lines are only JSON-decoded when a member ID occurs in the raw bytes; runs in pool workers.
+    """
+    hit = re.compile(id_pattern).search
+    coauthor = canonical_openalex_id(coauthor_id).upper() if coauthor_id else ""
+    works: List[Dict[str, Any]] = []
+    nbytes = 0
+    with gzip.open(path, "rb") as fh:
+        for line in fh:
+            nbytes += len(line)
+            if not hit(line):
+                continue
+            w = json.loads(line)
+            ids = work_author_ids(w)
+            if ids.isdisjoint(author_ids) or (coauthor and coauthor not in ids):
+                continue
+            works.append({k: w[k] for k in select if k in w} if select else w)
+    return works, nbytes
+
+
+def collect_snapshot_works(
+    snapshot_dir: Path,
+    members: List[Member],
+    limit_per_member: int = 0,
+    coauthor_id: Optional[str] = None,
+    select: Optional[List[str]] = WORK_SELECT_FIELDS,
+    workers: int = 0,
+    on_work: Optional[WorkHook] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    collect_works() from local snapshot partitions instead of the API. Partitions
+    are scanned in worker processes; a work found in several partitions keeps its
+    newest (last) copy. limit_per_member keeps each member's newest N works.
+    """
+    parts = snapshot_partitions(snapshot_dir)
+    if not parts:
+        raise SystemExit(f"No .gz works partitions found in {snapshot_dir}")
+
+    fetchable = [m for m in members if m.openalex_author_id]
+    for m in members:
+        if not m.openalex_author_id:
+            print(f"[WARN] No OpenAlex author ID for member: {m.name} (add openalex_author_id to fix)")
+    author_ids = frozenset(canonical_openalex_id(m.openalex_author_id).upper() for m in fetchable)
+    if not author_ids:
+        return {}
+
+    workers = workers or (os.cpu_count() or 1)
+    print(f"[INFO] Scanning {len(parts)} snapshot partitions for {len(author_ids)} authors ({workers} workers)")
+    scan = functools.partial(
+        scan_snapshot_partition,
+        id_pattern=_author_ids_pattern(author_ids),
+        author_ids=author_ids,
+        coauthor_id=coauthor_id,
+        select=select,
+    )
+
+    works_by_id: Dict[str, Dict[str, Any]] = {}
+    total_bytes = 0
+
+    def merge(results: Iterable[Tuple[List[Dict[str, Any]], int]]) -> None:
+        nonlocal total_bytes
+        for works, nbytes in results:
+            total_bytes += nbytes
+            for w in works:
+                works_by_id[canonical_openalex_id(w.get("id") or "")] = w
+
+    if workers <= 1 or len(parts) <= 1:
+        merge(scan(p) for p in parts)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            merge(pool.map(scan, parts))
+    print(f"[INFO] Snapshot: {total_bytes / 1e6:.1f} MB scanned, {len(works_by_id)} works by members.")
+
+    if limit_per_member:
+        newest = sorted(works_by_id.values(), key=lambda w: str(w.get("publication_date") or ""), reverse=True)
+        budget = dict.fromkeys(author_ids, 0)
+        keep: set[str] = set()
+        for w in newest:
+            hits = [aid for aid in work_author_ids(w) if aid in budget and budget[aid] < limit_per_member]
+            for aid in hits:
+                budget[aid] += 1
+            if hits:
+                keep.add(canonical_openalex_id(w.get("id") or ""))
+        works_by_id = {wid: w for wid, w in works_by_id.items() if wid in keep}
+
+    if on_work:
+        transformed: Dict[str, Dict[str, Any]] = {}
+        for wid, w in works_by_id.items():
+            kept = on_work(w)
+            if kept is not None:
+                transformed[wid] = kept
+        works_by_id = transformed
+    return works_by_id
+
+
+# ----------------------------
+# Metrics refresh (--refresh)
+# ----------------------------
+
+# Everything pick_best_link(), pick_venue() and a DOI dedupe_key need, plus the citation count.
+REFRESH_SELECT_FIELDS = ["id", "doi", "primary_location", "cited_by_count"]
+
+
+def refresh_publications(
+    client: OpenAlexClient,
+    pubs_dir: Path,
+    index: PublicationsIndex,
+    batch_size: int = OPENALEX_MAX_OR_VALUES,
+) -> Tuple[Dict[str, int], Dict[str, Dict[str, Any]]]:
+    """
+    Re-read link, venue and DOI-based dedupe_key of every synced publication from
+    OpenAlex, OPENALEX_MAX_OR_VALUES works per request, and rewrite only files
+    whose front matter changes. Titles, authors and manual edits are untouched.
+    Returns (counts, {work id: fetched work}).
+    """
+    wids = sorted(index.by_work_id)
+    batch_size = max(1, min(batch_size, OPENALEX_MAX_OR_VALUES))
+    fetched: Dict[str, Dict[str, Any]] = {}
+    for i in range(0, len(wids), batch_size):
+        for w in client.iter_works_by_ids(wids[i:i + batch_size], select=REFRESH_SELECT_FIELDS):
+            fetched[canonical_openalex_id(w.get("id") or "").upper()] = w
+
+    counts = {"checked": len(wids), "updated": 0, "unchanged": 0, "missing": 0}
+    for wid in wids:
+        w = fetched.get(canonical_openalex_id(wid).upper())
+        if w is None:
+            counts["missing"] += 1
+            continue
+        patch = {"link": pick_best_link(w), "venue": pick_venue(w)}
+        if normalized_doi(w):
+            # title/year/author keys need fields this lookup doesn't select; keep those as written
+            patch["dedupe_key"] = work_dedupe_key(w)
+        for name in list(index.by_work_id.get(wid) or []):
+            old_fm, body = index.front_matter(name)
+            new_fm = {**old_fm, **patch}
+            if front_matter_differs(old_fm, new_fm):
+                p = pubs_dir / name
+                write_front_matter_md(p, new_fm, body=body)
+                index.refresh(p)
+                counts["updated"] += 1
+            else:
+                counts["unchanged"] += 1
+    return counts, fetched
+
+
+def refresh_snapshot(path: Path, fetched: Dict[str, Dict[str, Any]]) -> Tuple[bool, Dict[str, int]]:
+    """Patch link/venue/doi/cited_by_count of the refreshed works into an existing export_snapshot() file."""
+    if not path.exists():
+        return False, {}
+    records = json.loads(path.read_text(encoding="utf-8"))
+    for r in records:
+        w = fetched.get(str(r.get("openalex_work_id") or "").upper())
+        if w is None:
+            continue
+        r.update(link=pick_best_link(w), venue=pick_venue(w), doi=normalized_doi(w), cited_by_count=int(w.get("cited_by_count") or 0))
+        if normalized_doi(w):
+            r["dedupe_key"] = work_dedupe_key(w)
+    return export_snapshot(path, records)
 
 
 def find_marc(resolved: List[Member]) -> Member:
@@ -599,7 +2560,7 @@ def find_marc(resolved: List[Member]) -> Member:
 # Main
 # ----------------------------
 
-def main() -> None:
+def build_arg_parser() -> argparse.ArgumentParser:
     ap = argparse.ArgumentParser()
     ap.add_argument("--repo", default=".", help="Path to your Jekyll repo root")
     ap.add_argument("--members-dir", default="_members", help="Members collection dir (relative to repo)")
@@ -607,10 +2568,233 @@ def main() -> None:
     ap.add_argument("--mailto", required=True, help="Email for OpenAlex polite pool")
     ap.add_argument("--institution-hint", default="", help="Prefer authors whose institution matches this text")
     ap.add_argument("--max-authors-per-paper", type=int, default=12, help="Max authors to list before adding 'et al.'")
-    ap.add_argument("--limit-works-per-member", type=int, default=0, help="0 = no limit; otherwise only newest N works per member (approx)")
+    ap.add_argument(
+        "--limit-works-per-member",
+        type=int,
+        default=0,
+        help="0 = no limit; otherwise only the newest N works per member (by publication_date, in either --fetch-mode)",
+    )
     ap.add_argument("--cache-file", default=".openalex_author_cache.json", help="Cache file to store chosen author IDs")
+    ap.add_argument(
+        "--author-cache-ttl-days",
+        type=float,
+        default=14.0,
+        help="Retry author searches that found no candidates after this many days",
+    )
+    ap.add_argument(
+        "--author-report-file",
+        default=".openalex_author_report.json",
+        help="Where to write the author-ID confidence report (empty string disables)",
+    )
     ap.add_argument("--wipe-publications-dir", action="store_true", help="Delete existing publications before writing new ones")
-    args = ap.parse_args()
+    ap.add_argument(
+        "--request-interval",
+        type=float,
+        default=0.12,
+        help="Initial seconds between OpenAlex requests across all threads; adapts toward --max-rps (0 = no limit)",
+    )
+    ap.add_argument("--max-rps", type=float, default=10.0, help="Ceiling for the adaptive request rate (requests/s)")
+    ap.add_argument("--max-retries", type=int, default=5, help="Retries per request on 429/5xx/connection errors")
+    ap.add_argument("--fetch-concurrency", type=int, default=1, help="Fetch up to N members' works in parallel (shared rate limit)")
+    ap.add_argument(
+        "--fetch-mode",
+        choices=["per-member", "batched"],
+        default="per-member",
+        help="per-member: one cursor chain per member; batched: one OR-filter chain per batch of members",
+    )
+    ap.add_argument(
+        "--server-side-pi-filter",
+        action="store_true",
+        help="Only request works co-authored by Marc (needs his openalex_author_id; else falls back to local filtering)",
+    )
+    ap.add_argument("--full-records", action="store_true", help="Request full work objects (no select= field projection)")
+    ap.add_argument(
+        "--debug-bytes",
+        action="store_true",
+        help="Report bytes received and estimate bytes saved by select= (re-fetches each chain's first page)",
+    )
+    ap.add_argument("--http-cache-dir", default=".openalex_http_cache", help="On-disk OpenAlex response cache ('' disables)")
+    ap.add_argument(
+        "--http-cache-ttl",
+        type=float,
+        default=0.0,
+        help="Hours a cached response is served without asking OpenAlex (default 0: always revalidate via ETag; "
+        "ignored by --refresh)",
+    )
+    ap.add_argument("--offline", action="store_true", help="Replay the response cache only; never touch the network")
+    ap.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only fetch works created/updated since each member's last sync (state in --sync-state-file)",
+    )
+    ap.add_argument("--sync-state-file", default=".openalex_sync_state.json", help="Incremental sync watermarks + stored works")
+    ap.add_argument("--incremental-overlap-days", type=float, default=1.0, help="Re-fetch this many days before the watermark")
+    ap.add_argument("--full-resync-days", type=float, default=30.0, help="Full refetch per member after N days (0 = never)")
+    ap.add_argument("--api-key", default="", help="OpenAlex API key (from_updated_date may require one)")
+    ap.add_argument(
+        "--checkpoint-file",
+        default=".openalex_fetch_checkpoint.jsonl",
+        help="Fetch progress log (per-chain next_cursor + works so far); removed after a complete fetch ('' disables)",
+    )
+    ap.add_argument("--resume", action="store_true", help="Continue an interrupted fetch from --checkpoint-file")
+    ap.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Only update link/venue/dedupe_key of existing publications (and the snapshot) by batched work-ID lookups",
+    )
+    ap.add_argument(
+        "--snapshot-dir",
+        default="",
+        help="Read works from a local OpenAlex snapshot (gzipped JSON Lines partitions) instead of the API",
+    )
+    ap.add_argument("--snapshot-workers", type=int, default=0, help="Processes scanning snapshot partitions (0 = one per CPU)")
+    ap.add_argument(
+        "--front-matter-cache-file",
+        default=".front_matter_cache.json",
+        help="Sidecar cache of parsed _members/_publications front matter ('' disables persistence)",
+    )
+    ap.add_argument(
+        "--write-mode",
+        choices=["skip-existing", "upsert"],
+        default="skip-existing",
+        help="skip-existing: never touch existing files; upsert: update files whose front matter changed",
+    )
+    ap.add_argument(
+        "--order-scheme",
+        choices=["stable", "sequential"],
+        default="stable",
+        help="stable: only a per-work sort_key (date + work ID), so new papers don't touch other files; "
+        "sequential: also write order: 1..N (newest first), which renumbers every file on insert",
+    )
+    ap.add_argument(
+        "--delete-stale",
+        action="store_true",
+        help="With --write-mode upsert: delete synced files whose work is no longer kept",
+    )
+    ap.add_argument("--profile", action="store_true", help="Print per-stage timings and HTTP/file counters at the end")
+    ap.add_argument("--profile-json", default="", help="Also write the --profile numbers as JSON to this file")
+    ap.add_argument("--cprofile", default="", help="Dump cProfile stats of the whole run to this file")
+    ap.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Reduce works to compact records and drop non-Marc works as pages arrive (low memory)",
+    )
+    ap.add_argument("--batch-size", type=int, default=50, help=f"Members per OR-filter query in batched mode (max {OPENALEX_MAX_OR_VALUES})")
+    ap.add_argument(
+        "--snapshot-file",
+        default="_data/publications.json",
+        help="Also write all kept publications to this JSON file ('' disables)",
+    )
+    ap.add_argument(
+        "--publications-include",
+        default="_includes/publications-list.html",
+        help="Pre-rendered, pre-sorted publication list for Jekyll; <stem>-recent.html gets the newest "
+        "--recent-publications ('' disables)",
+    )
+    ap.add_argument("--recent-publications", type=int, default=5, help="Papers in the -recent include (home page)")
+    ap.add_argument(
+        "--search-index-dir",
+        default="assets/js/lunr",
+        help="Write a prebuilt lunr index of the publications and publications-search.js here "
+        "(needs the optional 'lunr' package; '' disables)",
+    )
+    ap.add_argument(
+        "--fuzzy-dedupe-threshold",
+        type=float,
+        default=0.8,
+        help="Title token similarity (0-1) above which works sharing authors are merged as near-duplicates; 0 disables",
+    )
+    return ap
+
+
+def make_client(
+    args: argparse.Namespace,
+    repo: Path,
+    session_factory: Optional[Callable[[], Any]],
+    stats: SyncStats,
+) -> Tuple[OpenAlexClient, Optional[ResponseCache]]:
+    http_cache: Optional[ResponseCache] = None
+    if args.http_cache_dir:
+        # --refresh exists to pick up changed metadata: never serve an entry unrevalidated
+        ttl_s = 0.0 if args.refresh else args.http_cache_ttl * 3600
+        http_cache = ResponseCache(repo / args.http_cache_dir, ttl_s=ttl_s, offline=args.offline)
+
+    client = OpenAlexClient(
+        mailto=args.mailto,
+        sleep_s=args.request_interval,
+        max_rps=args.max_rps,
+        max_retries=args.max_retries,
+        cache=http_cache,
+        api_key=args.api_key or None,
+        work_select=None if args.full_records else WORK_SELECT_FIELDS,
+        measure_select_savings=args.debug_bytes and not args.full_records,
+        session_factory=session_factory,
+        stats=stats,
+    )
+    return client, http_cache
+
+
+def run_refresh(
+    args: argparse.Namespace,
+    repo: Path,
+    pubs_dir: Path,
+    fm_cache: FrontMatterCache,
+    session_factory: Optional[Callable[[], Any]],
+    stats: SyncStats,
+) -> SyncStats:
+    """--refresh: update link/venue/dedupe_key of existing publications (and the snapshot) without a resync."""
+    client, _http_cache = make_client(args, repo, session_factory, stats)
+
+    with stats.stage("index"):
+        index = PublicationsIndex(pubs_dir, cache=fm_cache)
+    parsed_before_writes = index.parsed
+
+    with stats.stage("refresh"):
+        counts, fetched = refresh_publications(client, pubs_dir, index)
+
+    if args.snapshot_file:
+        with stats.stage("snapshot"):
+            written, _diff = refresh_snapshot(repo / args.snapshot_file, fetched)
+            if written:
+                stats.files_written += 1
+
+    write_publication_assets(args, repo, index, stats)
+
+    with stats.stage("index"):
+        index.save()
+
+    stats.files_parsed += parsed_before_writes
+    stats.files_written += index.parsed - parsed_before_writes
+    requests_made = sum(int(h["requests"]) for h in stats.http.values())
+    cache_hits = sum(int(h["cache_hits"]) for h in stats.http.values())
+    print(
+        f"[DONE] Refreshed {pubs_dir}: {counts['checked']} works checked in {requests_made} requests "
+        f"({cache_hits} served from cache), "
+        f"{counts['updated']} files updated, {counts['unchanged']} unchanged, {counts['missing']} not found."
+    )
+    if args.profile:
+        print(stats.report())
+    if args.profile_json:
+        Path(args.profile_json).write_text(json.dumps(stats.as_dict(), indent=2), encoding="utf-8")
+    return stats
+
+
+def run(args: argparse.Namespace, session_factory: Optional[Callable[[], Any]] = None) -> SyncStats:
+    """
+    Run one sync with parsed CLI args. session_factory replaces requests.Session
+    (the benchmark harness passes a stand-in that replays recorded OpenAlex pages).
+    """
+    stats = SyncStats()
+
+    # flag conflicts are rejected before anything on disk is touched
+    if args.refresh and args.wipe_publications_dir:
+        raise SystemExit("--refresh updates existing publications; drop --wipe-publications-dir")
+    if args.resume and not args.checkpoint_file:
+        raise SystemExit("--resume needs --checkpoint-file")
+    if args.snapshot_dir and (args.incremental or args.resume):
+        raise SystemExit("--snapshot-dir reads everything locally; drop --incremental/--resume")
+    if args.offline and not args.http_cache_dir:
+        raise SystemExit("--offline needs --http-cache-dir")
 
     repo = Path(args.repo).resolve()
     members_dir = repo / args.members_dir
@@ -626,23 +2810,55 @@ def main() -> None:
     if cache_path.exists():
         cache = json.loads(cache_path.read_text(encoding="utf-8"))
 
-    members = load_members(members_dir)
-    if not members:
-        raise SystemExit(f"No members found in {members_dir}")
+    fm_cache = FrontMatterCache((repo / args.front_matter_cache_file) if args.front_matter_cache_file else None)
 
-    client = OpenAlexClient(mailto=args.mailto)
+    if args.refresh:
+        return run_refresh(args, repo, pubs_dir, fm_cache, session_factory, stats)
 
-    # Resolve OpenAlex author IDs
-    resolved: List[Member] = []
-    for m in members:
-        if m.openalex_author_id:
-            resolved.append(Member(m.name, m.name_norm, canonical_openalex_id(m.openalex_author_id)))
-            continue
+    with stats.stage("load_members"):
+        members = load_members(members_dir, fm_cache)
+        stats.files_parsed += fm_cache.parsed
+        if not members:
+            raise SystemExit(f"No members found in {members_dir}")
+
+    client, http_cache = make_client(args, repo, session_factory, stats)
 
-        aid = choose_author_id(client, m, args.institution_hint or None, cache)
-        resolved.append(Member(m.name, m.name_norm, canonical_openalex_id(aid) if aid else None))
+    with stats.stage("resolve_authors"):
+        # Resolve OpenAlex author IDs: the PI first, then everyone else scored against the PI's co-authors
+        # (a --snapshot-dir sync makes no API calls: pinned and cached IDs only)
+        hint = args.institution_hint or None
+        lookup = not args.snapshot_dir
+        pi_resolved, _ = resolve_members(
+            client, [find_marc(members)], hint, cache, negative_ttl_days=args.author_cache_ttl_days, lookup=lookup
+        )
+        pi_id = pi_resolved[0].openalex_author_id
+        now = datetime.now(timezone.utc)
+        coauthors: frozenset = frozenset()
+        if lookup and pi_id and any(
+            not m.openalex_author_id
+            and (m.name_norm not in cache or author_cache_entry_expired(cache[m.name_norm], args.author_cache_ttl_days, now))
+            for m in members
+        ):
+            coauthors = pi_coauthor_ids(client, pi_id)
+
+        resolved, author_report = resolve_members(
+            client,
+            members,
+            hint,
+            cache,
+            pi_coauthors=coauthors,
+            concurrency=args.fetch_concurrency,
+            negative_ttl_days=args.author_cache_ttl_days,
+            lookup=lookup,
+        )
 
-    cache_path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+        cache_path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+        if args.author_report_file:
+            write_author_report(repo / args.author_report_file, author_report)
+        # members without any ID are warned about below
+        low = [r["name"] for r in author_report if r["needs_pin"] and r["openalex_author_id"]]
+        if low:
+            print(f"[WARN] Low-confidence OpenAlex author picks (pin openalex_author_id): {', '.join(low)}")
 
     marc = find_marc(resolved)
     if not marc.openalex_author_id:
@@ -654,101 +2870,261 @@ def main() -> None:
     member_name_norms = {m.name_norm for m in resolved}
     member_author_ids: set[str] = {canonical_openalex_id(m.openalex_author_id) for m in resolved if m.openalex_author_id}
 
-    # Collect works across all members (dedupe by OpenAlex work id initially)
-    works_by_id: Dict[str, Dict[str, Any]] = {}
-
-    for m in resolved:
-        if not m.openalex_author_id:
-            print(f"[WARN] No OpenAlex author ID for member: {m.name} (add openalex_author_id to fix)")
-            continue
-
-        print(f"[INFO] Fetching works for {m.name} ({m.openalex_author_id})")
-        count = 0
-        for w in client.iter_works_by_author(m.openalex_author_id, per_page=200):
-            wid = canonical_openalex_id(w.get("id") or "")
-            if not wid:
-                continue
-            works_by_id[wid] = w
-            count += 1
-            if args.limit_works_per_member and count >= args.limit_works_per_member:
-                break
-
-    works_all = sorted(list(works_by_id.values()), key=work_sort_key, reverse=True)
-
-    # Keep only works where Marc is an author
-    works_kept = [w for w in works_all if work_has_author(w, marc_author_ids, marc_name_norm)]
-    num_works_skipped_exist = 0
-
-    # Dedupe “same paper” across different OpenAlex work IDs
-    works_kept = dedupe_works(works_kept)
-
-    # EXTRA: Remove near-duplicates that share identical lowercase titles (even if OpenAlex IDs/dedupe_key differ)
-    works_kept = dedupe_works_by_title_lower(works_kept)
-
-    # Sort newest-first after all dedupe
-    works_kept = sorted(works_kept, key=work_sort_key, reverse=True)
-
-    print(f"[INFO] Works total (all members): {len(works_all)}")
+    coauthor_id: Optional[str] = None
+    if args.server_side_pi_filter:
+        if marc.openalex_author_id:
+            coauthor_id = canonical_openalex_id(marc.openalex_author_id)
+        else:
+            print("[WARN] --server-side-pi-filter needs Marc's openalex_author_id; filtering locally instead.")
+
+    seen_work_ids: set[str] = set()
+
+    def keep_compact(w: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        seen_work_ids.add(canonical_openalex_id(w.get("id") or ""))
+        return compact_work(w) if work_has_author(w, marc_author_ids, marc_name_norm) else None
+
+    batch_size = args.batch_size if args.fetch_mode == "batched" else 0
+    checkpoint = FetchCheckpoint(
+        repo / args.checkpoint_file,
+        # anything that changes what a cursor chain keeps
+        signature={
+            "limit": args.limit_works_per_member,
+            "limit_sort": LIMIT_SORT if args.limit_works_per_member else None,
+            "batch_size": batch_size,
+            "coauthor_id": coauthor_id,
+            "select": client.work_select,
+            "streaming": args.streaming,
+        },
+        resume=args.resume,
+    ) if args.checkpoint_file and not args.snapshot_dir else None
+
+    with stats.stage("fetch"):
+        # Collect works across all members (dedupe by OpenAlex work id initially)
+        try:
+            works_by_id = collect_snapshot_works(
+                Path(args.snapshot_dir),
+                resolved,
+                limit_per_member=args.limit_works_per_member,
+                coauthor_id=coauthor_id,
+                select=client.work_select,
+                workers=args.snapshot_workers,
+                on_work=keep_compact if args.streaming else None,
+            ) if args.snapshot_dir else collect_works(
+                client,
+                resolved,
+                limit_per_member=args.limit_works_per_member,
+                concurrency=args.fetch_concurrency,
+                batch_size=batch_size,
+                coauthor_id=coauthor_id,
+                state=SyncState(
+                    repo / args.sync_state_file,
+                    overlap_days=args.incremental_overlap_days,
+                    full_resync_days=args.full_resync_days,
+                ) if args.incremental else None,
+                on_work=keep_compact if args.streaming else None,
+                checkpoint=checkpoint,
+            )
+        except BaseException:
+            if checkpoint:
+                checkpoint.close()
+                print(f"[ERROR] Fetch interrupted; progress is in {args.checkpoint_file}, rerun with --resume.", file=sys.stderr)
+            raise
+        if checkpoint:
+            checkpoint.close(remove=True)
+
+    with stats.stage("filter"):
+        records = [PublicationRecord.from_work(w) for w in works_by_id.values()]
+        works_all = sorted(records, key=work_sort_key, reverse=True)
+
+        # Keep only works where Marc is an author
+        works_kept = [w for w in works_all if work_has_author(w, marc_author_ids, marc_name_norm)]
+
+    with stats.stage("dedupe"):
+        # Dedupe “same paper” across different OpenAlex work IDs
+        works_kept = dedupe_works(works_kept)
+
+        # EXTRA: Remove near-duplicates that share identical lowercase titles (even if OpenAlex IDs/dedupe_key differ)
+        works_kept = dedupe_works_by_title_lower(works_kept)
+
+        # Merge preprint/published pairs whose titles differ slightly (LaTeX, punctuation, wording)
+        superseded: Dict[str, str] = {}
+        if args.fuzzy_dedupe_threshold > 0:
+            works_kept, superseded = fuzzy_dedupe_works(works_kept, threshold=args.fuzzy_dedupe_threshold)
+            if superseded:
+                print(f"[INFO] Merged {len(superseded)} near-duplicate works (similar title, shared authors).")
+
+        # Sort newest-first after all dedupe
+        works_kept = sorted(works_kept, key=work_sort_key, reverse=True)
+
+    print(f"[INFO] Works total (all members): {len(seen_work_ids) if args.streaming else len(works_all)}")
     print(f"[INFO] Works kept (Marc is author): {len(works_kept)}")
 
-    # Write out files with sequential order (1 = most recent)
-    for idx, w in enumerate(works_kept, start=1):
-        title_raw = sanitize_yaml_scalar((w.get("display_name") or "Untitled").strip()) or "Untitled"
-        title = title_case_paper_title(title_raw)
+    with stats.stage("index"):
+        index = PublicationsIndex(pubs_dir, cache=fm_cache)
+        print(f"[INFO] Publications index: {len(index.entries)} files ({index.parsed} parsed).")
+    parsed_before_writes = index.parsed
 
-        date_full = publication_date_yyyy_mm_dd(w)
-        year = int(date_full[:4]) if re.fullmatch(r"\d{4}-\d{2}-\d{2}", date_full) else (int(w.get("publication_year") or 0) or 0)
+    num_works_skipped_exist = 0
+    write_counts = {"created": 0, "updated": 0, "renamed": 0, "unchanged": 0, "deleted": 0}
+    kept_names: set[str] = set()
+    snapshot: List[Dict[str, Any]] = []
+
+    with stats.stage("write"):
+        with stats.stage("write.title_case"):
+            titles = title_case_many(sanitize_yaml_scalar((w.title or "Untitled").strip()) or "Untitled" for w in works_kept)
+
+        # stable: per-work sort_key only; sequential: also `order` (1 = most recent), renumbering on every insert
+        sequential = args.order_scheme == "sequential"
+        drop_keys = () if sequential else ("order",)
+        for idx, (w, title) in enumerate(zip(works_kept, titles), start=1):
+            date_full = publication_date_yyyy_mm_dd(w)
+            year = int(date_full[:4]) if _DATE_RE.fullmatch(date_full) else w.publication_year
+
+            link = pick_best_link(w)
+            venue = pick_venue(w)
+
+            authors = format_authors(
+                authorships=w,
+                member_name_norms=member_name_norms,
+                member_author_ids=member_author_ids,
+                max_authors=args.max_authors_per_paper,
+            )
+            authors_html = authors_to_html(authors)
+
+            wid = w.work_id
+            dkey = work_dedupe_key(w)
+
+            # Filename includes full date and title + openalex work id
+            fname = f"{date_full}-{slugify(title)}-{wid}.md"
+            out_path = pubs_dir / fname
+
+            fm = {
+                "title": title,
+                "authors": authors,
+                "authors_html": authors_html,
+                "date": date_full,  # YYYY-MM-DD
+                "year": year if year else "unknown",
+                "link": link,
+                "venue": venue,
+                "sort_key": publication_sort_key(date_full, wid),
+                "openalex_work_id": wid,
+                "dedupe_key": dkey,
+            }
+            if sequential:
+                fm["order"] = idx
+
+            with stats.stage("write.files"):
+                written_name = fname
+                if args.write_mode == "upsert":
+                    status, written_name = upsert_publication(pubs_dir, index, fname, fm, drop_keys=drop_keys)
+                    write_counts[status] += 1
+                    kept_names.add(written_name)
+                elif fname in index or index.by_work_id.get(wid):
+                    num_works_skipped_exist += 1
+                    written_name = fname if fname in index else index.by_work_id[wid][0]
+                else:
+                    write_front_matter_md(out_path, fm, body="")
+                    index.refresh(out_path)
+
+            on_paper = work_members(w, resolved)
+            snapshot.append({
+                **fm,
+                "file": written_name,
+                "doi": normalized_doi(w),
+                "cited_by_count": w.cited_by_count,
+                "members": [m.name for m in on_paper],
+                "member_ids": [canonical_openalex_id(m.openalex_author_id).upper() for m in on_paper if m.openalex_author_id],
+            })
+
+        if args.write_mode == "upsert" and args.delete_stale:
+            write_counts["deleted"] += delete_stale_publications(pubs_dir, index, kept_names)
+
+    with stats.stage("harmonize_titles"):
+        # Harmonize titles in existing publication files (from prior runs / manual edits)
+        num_titles_fixed = harmonize_publication_titles_in_dir(pubs_dir, index)
+        if num_titles_fixed:
+            print(f"[INFO] Harmonized title case in {num_titles_fixed} existing publication files.")
+
+    with stats.stage("prune"):
+        # Remove duplicate publication files with identical lowercase titles
+        deleted = prune_publications_with_identical_titles(pubs_dir, index)
+        if deleted:
+            print(f"[INFO] Removed {deleted} duplicate publication files (identical lowercase title).")
+        write_counts["deleted"] += deleted
+
+        # Remove files of works merged into a near-duplicate by fuzzy dedupe
+        deleted = prune_superseded_publications(pubs_dir, superseded, index)
+        if deleted:
+            print(f"[INFO] Removed {deleted} publication files superseded by a near-duplicate.")
+        write_counts["deleted"] += deleted
+
+    with stats.stage("index"):
+        index.save()
+
+    if args.snapshot_file:
+        with stats.stage("snapshot"):
+            # files removed by the prune stage are not kept publications
+            written, diff = export_snapshot(repo / args.snapshot_file, [r for r in snapshot if r["file"] in index])
+            if written:
+                stats.files_written += 1
+                print(
+                    f"[INFO] Snapshot {args.snapshot_file}: {diff['added']} added, "
+                    f"{diff['removed']} removed, {diff['changed']} changed."
+                )
+
+    write_publication_assets(args, repo, index, stats)
+
+    # every write re-parses the file into the index; parses after the initial build are writes
+    stats.files_parsed += parsed_before_writes
+    stats.files_written += index.parsed - parsed_before_writes
+
+    if http_cache:
+        print(
+            f"[INFO] HTTP cache: {http_cache.hits} hits, {http_cache.revalidated} revalidated, "
+            f"{http_cache.misses} fetched."
+        )
 
-        link = pick_best_link(w)
-        venue = pick_venue(w)
+    if args.debug_bytes:
+        print(f"[DEBUG] Received {client.bytes_received:,} bytes from OpenAlex.")
+        saved = client.select_savings_estimate()
+        if saved is not None:
+            print(
+                f"[DEBUG] select= saved ~{saved:,} bytes on /works pages "
+                f"(estimated from {client.sampled_full_bytes:,} vs {client.sampled_select_bytes:,} sampled bytes)."
+            )
 
-        authorships = w.get("authorships") or []
-        authors = format_authors(
-            authorships=authorships,
-            member_name_norms=member_name_norms,
-            member_author_ids=member_author_ids,
-            max_authors=args.max_authors_per_paper,
+    if args.write_mode == "upsert":
+        summary = ", ".join(f"{n} {status}" for status, n in write_counts.items())
+        print(f"[DONE] Publication files in {pubs_dir}: {summary}")
+    else:
+        print(
+            f"[DONE] Wrote {len(works_kept) - num_works_skipped_exist} "
+            f"({num_works_skipped_exist} skipped because existed) publication files to {pubs_dir}"
         )
 
-        wid = canonical_openalex_id(w.get("id") or "")
-        dkey = work_dedupe_key(w)
-
-        # Filename includes full date and title + openalex work id
-        fname = f"{date_full}-{slugify(title)}-{wid}.md"
-        out_path = pubs_dir / fname
-
-        fm = {
-            "title": title,
-            "authors": authors,
-            "date": date_full,  # YYYY-MM-DD
-            "year": year if year else "unknown",
-            "link": link,
-            "venue": venue,
-            "order": idx,
-            "openalex_work_id": wid,
-            "dedupe_key": dkey,
-        }
+    if args.profile:
+        print(stats.report())
+    if args.profile_json:
+        Path(args.profile_json).write_text(json.dumps(stats.as_dict(), indent=2), encoding="utf-8")
 
-        if os.path.exists(out_path):
-            num_works_skipped_exist += 1
-        else:
-            write_front_matter_md(out_path, fm, body="")
+    return stats
 
-    # Harmonize titles in existing publication files (from prior runs / manual edits)
-    num_titles_fixed = harmonize_publication_titles_in_dir(pubs_dir)
-    if num_titles_fixed:
-        print(f"[INFO] Harmonized title case in {num_titles_fixed} existing publication files.")
 
-    # Remove duplicate publication files with identical lowercase titles
-    deleted = prune_publications_with_identical_titles(pubs_dir)
-    if deleted:
-        print(f"[INFO] Removed {deleted} duplicate publication files (identical lowercase title).")
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_arg_parser().parse_args(argv)
+    if not args.cprofile:
+        run(args)
+        return
 
-    print(
-        f"[DONE] Wrote {len(works_kept) - num_works_skipped_exist} "
-        f"({num_works_skipped_exist} skipped because existed) publication files to {pubs_dir}"
-    )
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(run, args)
+    finally:
+        profiler.dump_stats(args.cprofile)
+        print(f"[INFO] cProfile stats written to {args.cprofile}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()